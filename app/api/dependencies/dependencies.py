@@ -1,13 +1,26 @@
 from functools import lru_cache
+from typing import Optional
 from app.core.agents.supervisor import ResuMateSupervisore
 from app.core.agents.builder import ModelConfig
-from app.core.memory import LocalMemory
-from app.core.storage import LocalDocumentStorage
+from app.core.browser_pool import BrowserPool, BrowserPoolConfig
+from app.core.jobs import RenderJobConfig, RenderJobQueue
+from app.core.preview import FragmentRenderer
+from app.core.render_cache import RenderCache, RenderCacheConfig
+from app.core.rendering import RenderPipeline
+from app.core.render_workers import RenderWorkerConfig, RenderWorkerPool
+from app.core.memory import AsyncMemory, BaseMemory, MemoryConfig, create_memory
+from app.core.storage import AsyncDocumentStorage, LocalDocumentStorage
+from app.core.templates import TemplateIndex, TemplateRegistry
 
 
 @lru_cache()
-def get_memory():
-    return LocalMemory()
+def get_memory() -> BaseMemory:
+    return create_memory(MemoryConfig())
+
+
+@lru_cache()
+def get_async_memory() -> AsyncMemory:
+    return AsyncMemory(get_memory())
 
 
 @lru_cache()
@@ -15,6 +28,65 @@ def get_storage():
     return LocalDocumentStorage()
 
 
+@lru_cache()
+def get_async_storage() -> AsyncDocumentStorage:
+    return AsyncDocumentStorage(get_storage())
+
+
+@lru_cache()
+def get_template_registry() -> TemplateRegistry:
+    return TemplateRegistry(template_folder=get_storage().template_folder)
+
+
+@lru_cache()
+def get_template_index() -> TemplateIndex:
+    return TemplateIndex(template_folder=get_storage().template_folder)
+
+
+@lru_cache()
+def get_fragment_renderer() -> FragmentRenderer:
+    return FragmentRenderer(registry=get_template_registry())
+
+
 @lru_cache()
 def get_assistant() -> ResuMateSupervisore:
     return ResuMateSupervisore(config=ModelConfig(), document_storage=get_storage())
+
+
+@lru_cache()
+def get_browser_pool() -> BrowserPool:
+    return BrowserPool(config=BrowserPoolConfig())
+
+
+@lru_cache()
+def get_render_cache() -> Optional[RenderCache]:
+    config = RenderCacheConfig()
+    if not config.enabled:
+        return None
+    return RenderCache(folder=config.folder, max_bytes=config.max_bytes)
+
+
+@lru_cache()
+def get_render_workers() -> Optional[RenderWorkerPool]:
+    config = RenderWorkerConfig()
+    if config.processes <= 0:
+        return None
+    return RenderWorkerPool(
+        template_folder=get_storage().template_folder, processes=config.processes
+    )
+
+
+@lru_cache()
+def get_render_pipeline() -> RenderPipeline:
+    return RenderPipeline(
+        storage=get_async_storage(),
+        registry=get_template_registry(),
+        browser_pool=get_browser_pool(),
+        cache=get_render_cache(),
+        workers=get_render_workers(),
+    )
+
+
+@lru_cache()
+def get_render_jobs() -> RenderJobQueue:
+    return RenderJobQueue(pipeline=get_render_pipeline(), config=RenderJobConfig())
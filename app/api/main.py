@@ -1,15 +1,44 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from app.api.routes.chat import chat_router
+from app.api.routes.jobs import jobs_router
 from app.api.routes.memory import memory_router
 from app.api.routes.resume import resume_router
 from app.api.routes.template import template_router
+from app.api.dependencies.dependencies import (
+    get_memory,
+    get_render_jobs,
+    get_render_pipeline,
+    get_template_index,
+)
+from app.core.memory import SQLiteMemory
 import logging
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    template_index = get_template_index()
+    render_pipeline = get_render_pipeline()
+    render_jobs = get_render_jobs()
+    await template_index.start()
+    await render_pipeline.start()
+    await render_jobs.start()
+    try:
+        yield
+    finally:
+        await render_jobs.stop()
+        await render_pipeline.stop()
+        await template_index.stop()
+        memory = get_memory()
+        if isinstance(memory, SQLiteMemory):
+            memory.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/")
@@ -26,6 +55,7 @@ async def redirect_root_to_docs() -> RedirectResponse:
 
 
 app.include_router(chat_router)
+app.include_router(jobs_router)
 app.include_router(memory_router)
 app.include_router(resume_router)
 app.include_router(template_router)
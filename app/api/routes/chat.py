@@ -1,10 +1,10 @@
 from fastapi.responses import StreamingResponse
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from app.api.dependencies.dependencies import get_assistant, get_memory
+from app.api.dependencies.dependencies import get_assistant, get_async_memory
 from app.core.agents.supervisor import ResuMateSupervisore
 from typing import Optional
-from app.core.memory import LocalMemory
+from app.core.memory import AsyncMemory
 
 chat_router = APIRouter(prefix="/chat", tags=["chat"])
 
@@ -19,9 +19,9 @@ class ChatRequest(BaseModel):
 async def chat_endpoint(
     chat_request: ChatRequest,
     assistant: ResuMateSupervisore = Depends(get_assistant),
-    memory: LocalMemory = Depends(get_memory),
+    memory: AsyncMemory = Depends(get_async_memory),
 ):
-    message_history = memory.get_conversation(chat_request.conversation_id)
+    message_history = await memory.get_messages(chat_request.conversation_id)
 
     return StreamingResponse(
         assistant.stream(
@@ -30,5 +30,6 @@ async def chat_endpoint(
             memory=memory,
             conversation_id=chat_request.conversation_id,
             resume_name=chat_request.resume_name,
-        )
+        ),
+        media_type="application/x-ndjson",
     )
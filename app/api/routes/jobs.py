@@ -0,0 +1,90 @@
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from app.api.dependencies.dependencies import get_render_jobs
+from app.core.jobs import (
+    JobPriority,
+    JobStatus,
+    RenderJobInfo,
+    RenderJobMetrics,
+    RenderJobQueue,
+)
+from typing import Any, Dict, Optional
+
+jobs_router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+class SubmitRenderJobRequest(BaseModel):
+    template_name: str
+    resume_name: str
+    template_variables: Optional[Dict[str, Any]] = None
+    priority: JobPriority = JobPriority.interactive
+    pdf: bool = True
+
+
+@jobs_router.post("/", response_model=RenderJobInfo, status_code=202)
+async def submit_render_job(
+    payload: SubmitRenderJobRequest,
+    jobs: RenderJobQueue = Depends(get_render_jobs),
+):
+    """Queue a render and return immediately; poll /jobs/{job_id} for its status."""
+    job = jobs.submit(
+        payload.template_name,
+        payload.resume_name,
+        payload.template_variables,
+        priority=payload.priority,
+        pdf=payload.pdf,
+    )
+    return job.info()
+
+
+@jobs_router.get("/metrics", response_model=RenderJobMetrics)
+async def get_render_job_metrics(jobs: RenderJobQueue = Depends(get_render_jobs)):
+    return jobs.metrics()
+
+
+@jobs_router.get("/{job_id}", response_model=RenderJobInfo)
+async def get_render_job(job_id: str, jobs: RenderJobQueue = Depends(get_render_jobs)):
+    job = jobs.get(job_id)
+    if not job:
+        return JSONResponse(status_code=404, content={"message": "Job not found"})
+    return job.info()
+
+
+@jobs_router.delete("/{job_id}", response_model=RenderJobInfo)
+async def cancel_render_job(
+    job_id: str, jobs: RenderJobQueue = Depends(get_render_jobs)
+):
+    job = jobs.get(job_id)
+    if not job:
+        return JSONResponse(status_code=404, content={"message": "Job not found"})
+    if not jobs.cancel(job_id):
+        return JSONResponse(
+            status_code=409, content={"message": f"Job already {job.status.value}"}
+        )
+    return job.info()
+
+
+@jobs_router.get("/{job_id}/html")
+async def get_render_job_html(
+    job_id: str, jobs: RenderJobQueue = Depends(get_render_jobs)
+):
+    job = jobs.get(job_id)
+    if not job or job.status != JobStatus.done or job.artifact is None:
+        return JSONResponse(status_code=404, content={"message": "Result not found"})
+    return Response(content=job.artifact.html, media_type="text/html")
+
+
+@jobs_router.get("/{job_id}/pdf")
+async def get_render_job_pdf(
+    job_id: str, jobs: RenderJobQueue = Depends(get_render_jobs)
+):
+    job = jobs.get(job_id)
+    if (
+        not job
+        or job.status != JobStatus.done
+        or job.artifact is None
+        or job.artifact.pdf is None
+    ):
+        return JSONResponse(status_code=404, content={"message": "Result not found"})
+    return Response(content=job.artifact.pdf, media_type="application/pdf")
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from app.api.dependencies.dependencies import get_memory
-from app.core.memory import LocalMemory
+from pydantic_ai.messages import ModelRequest, UserPromptPart
+from app.api.dependencies.dependencies import get_async_memory
+from app.core.memory import AsyncMemory
 from typing import Any, Dict, List, Optional
 
 memory_router = APIRouter(prefix="/memory", tags=["memory"])
@@ -46,17 +48,24 @@ class AddUserMessageRequest(BaseModel):
     "/conversations/{conversation_id}/messages", response_model=List[Message]
 )
 async def chat_history_endpoint(
-    conversation_id: str, memory: LocalMemory = Depends(get_memory)
-) -> List[Message]:
-    message_history = memory.get_conversation(conversation_id)
-    return message_history
+    conversation_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: Optional[int] = Query(default=None, ge=1),
+    memory: AsyncMemory = Depends(get_async_memory),
+) -> JSONResponse:
+    # payloads are already JSON-ready; skip re-validating them against Message
+    message_history = await memory.get_conversation(
+        conversation_id, offset=offset, limit=limit
+    )
+    return JSONResponse(content=message_history)
 
 
 @memory_router.post("/add_user_message", response_model=StatusResponse)
 async def add_user_message_endpoint(
-    request: AddUserMessageRequest, memory: LocalMemory = Depends(get_memory)
+    request: AddUserMessageRequest, memory: AsyncMemory = Depends(get_async_memory)
 ) -> StatusResponse:
-    memory.add_message(
-        request.conversation_id, {"role": "user", "content": request.message}
+    await memory.add_message(
+        request.conversation_id,
+        ModelRequest(parts=[UserPromptPart(content=request.message)]),
     )
     return StatusResponse(status="message added")
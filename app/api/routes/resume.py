@@ -1,10 +1,11 @@
 from fastapi.responses import JSONResponse
-from fastapi import APIRouter, Depends, UploadFile, File
-from pydantic import BaseModel
-from app.api.dependencies.dependencies import get_storage
-from app.core.storage import LocalDocumentStorage
+from fastapi import APIRouter, Body, Depends, Header, Response, UploadFile, File
+from pydantic import BaseModel, Field
+from app.api.dependencies.dependencies import get_async_storage
+from app.core.revisions import ResumeDiff, ResumeRevision
+from app.core.storage import AsyncDocumentStorage, ResumeVersionConflict
 from app.models.resume import Resume
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 resume_router = APIRouter(prefix="/resume", tags=["resume"])
 
@@ -12,38 +13,264 @@ resume_router = APIRouter(prefix="/resume", tags=["resume"])
 class ResumeUploadResponse(BaseModel):
     filename: str
     status: str
+    version: int
+    etag: str
+
+
+class ElementResponse(BaseModel):
+    element_id: str
+    # location and content after the change, None once deleted
+    collection: Optional[str] = None
+    index: Optional[int] = None
+    element: Optional[Dict[str, Any]] = None
+    version: int
+    etag: str
+
+
+class InsertElementRequest(BaseModel):
+    element: Dict[str, Any] = {}
+    index: Optional[int] = None
+
+
+class MoveElementRequest(BaseModel):
+    index: int = Field(ge=0)
+
+
+ElementLocation = Tuple[str, Optional[str], Optional[int], Optional[Dict[str, Any]]]
+
+
+def _locate(resume: Resume, element_id: str) -> ElementLocation:
+    location = resume.find_element(element_id)
+    if location is None:
+        return element_id, None, None, None
+    collection, index = location
+    element = getattr(resume, collection)[index]
+    return element_id, collection, index, element.model_dump(mode="json")
+
+
+async def _update_element(
+    storage: AsyncDocumentStorage,
+    resume_name: str,
+    update: Callable[[Resume], Optional[ElementLocation]],
+    if_match: Optional[str],
+    not_found: str = "Element not found",
+) -> Response:
+    """Apply an element update and persist it, mapping failures to HTTP errors."""
+    try:
+        located, revision = await storage.update_resume(resume_name, update, if_match)
+    except FileNotFoundError:
+        return JSONResponse(status_code=404, content={"message": "Resume not found"})
+    except ResumeVersionConflict as conflict:
+        return _conflict_response(conflict)
+    except KeyError:
+        return JSONResponse(status_code=404, content={"message": not_found})
+    except (TypeError, ValueError) as e:  # includes pydantic's ValidationError
+        return JSONResponse(status_code=422, content={"message": str(e)})
+    if not located or revision is None:
+        return JSONResponse(status_code=404, content={"message": not_found})
+
+    element_id, collection, index, element = located
+    response = ElementResponse(
+        element_id=element_id,
+        collection=collection,
+        index=index,
+        element=element,
+        version=revision.version,
+        etag=revision.etag,
+    )
+    return JSONResponse(
+        content=response.model_dump(mode="json"), headers={"ETag": revision.etag}
+    )
+
+
+def _conflict_response(conflict: ResumeVersionConflict) -> JSONResponse:
+    current = conflict.current
+    return JSONResponse(
+        status_code=412,
+        content={
+            "message": "Resume was modified",
+            "current_version": current.version if current else None,
+        },
+        headers={"ETag": current.etag} if current else None,
+    )
 
 
 @resume_router.get("/list", response_model=List[str])
-async def list_resumes(storage: LocalDocumentStorage = Depends(get_storage)):
-    resumes = storage.list_resumes()
+async def list_resumes(storage: AsyncDocumentStorage = Depends(get_async_storage)):
+    resumes = await storage.list_resumes()
     return resumes
 
 
 @resume_router.post("/save", response_model=ResumeUploadResponse)
 async def save_resume(
     resume: Resume,
-    storage: LocalDocumentStorage = Depends(get_storage),
+    response: Response,
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
 ):
+    """
+    Save a resume as a new revision. Send the ETag of the revision the edit
+    is based on as If-Match to get a 412 instead of overwriting a newer save.
+    """
     final_yaml = resume.dump_to_yaml_string()
-    storage.save_resume(final_yaml, resume.name + ".yaml")
-    return ResumeUploadResponse(filename=resume.name + ".yaml", status="saved")
+    filename = resume.name + ".yaml"
+    try:
+        revision = await storage.save_resume(final_yaml, filename, if_match)
+    except ResumeVersionConflict as conflict:
+        return _conflict_response(conflict)
+    response.headers["ETag"] = revision.etag
+    return ResumeUploadResponse(
+        filename=filename, status="saved", version=revision.version, etag=revision.etag
+    )
 
 
 @resume_router.get("/{resume_name}", response_model=Resume)
 async def get_resume(
-    resume_name: str, storage: LocalDocumentStorage = Depends(get_storage)
+    resume_name: str,
+    response: Response,
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
 ):
-    resume = storage.get_resume(resume_name=resume_name)
+    try:
+        resume = await storage.get_resume(resume_name=resume_name)
+    except FileNotFoundError:
+        resume = None
     if not resume:
         return JSONResponse(status_code=404, content={"message": "Resume not found"})
+    revision = await storage.get_revision(resume_name)
+    if revision:
+        response.headers["ETag"] = revision.etag
+    return resume
+
+
+@resume_router.get("/{resume_name}/revisions", response_model=List[ResumeRevision])
+async def list_resume_revisions(
+    resume_name: str, storage: AsyncDocumentStorage = Depends(get_async_storage)
+):
+    return await storage.list_revisions(resume_name)
+
+
+@resume_router.get("/{resume_name}/revisions/{version}", response_model=Resume)
+async def get_resume_revision(
+    resume_name: str,
+    version: int,
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    resume = await storage.get_resume_revision(resume_name, version)
+    if not resume:
+        return JSONResponse(status_code=404, content={"message": "Revision not found"})
     return resume
 
 
+@resume_router.get("/{resume_name}/diff", response_model=ResumeDiff)
+async def diff_resume_revisions(
+    resume_name: str,
+    from_version: int,
+    to_version: Optional[int] = None,
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    """Changes between two revisions, by default up to the current one."""
+    diff = await storage.diff_revisions(resume_name, from_version, to_version)
+    if diff is None:
+        return JSONResponse(status_code=404, content={"message": "Revision not found"})
+    return diff
+
+
+@resume_router.patch(
+    "/{resume_name}/elements/{element_id}", response_model=ElementResponse
+)
+async def patch_resume_element(
+    resume_name: str,
+    element_id: str,
+    changes: Dict[str, Any] = Body(...),
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    """Update some fields of one element (link, skill, experience, ...) and save the resume."""
+
+    def update(resume: Resume) -> Optional[ElementLocation]:
+        if resume.patch_element(element_id, changes) is None:
+            return None
+        return _locate(resume, element_id)
+
+    return await _update_element(storage, resume_name, update, if_match)
+
+
+@resume_router.post(
+    "/{resume_name}/elements/{collection}", response_model=ElementResponse
+)
+async def insert_resume_element(
+    resume_name: str,
+    collection: str,
+    payload: InsertElementRequest,
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    """Add an element to a collection (e.g. experience) at `index`, last by default."""
+
+    def update(resume: Resume) -> ElementLocation:
+        element = resume.insert_element(collection, payload.element, payload.index)
+        return _locate(resume, element.id)
+
+    return await _update_element(
+        storage, resume_name, update, if_match, not_found="Collection not found"
+    )
+
+
+@resume_router.delete(
+    "/{resume_name}/elements/{element_id}", response_model=ElementResponse
+)
+async def delete_resume_element(
+    resume_name: str,
+    element_id: str,
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    def update(resume: Resume) -> Optional[ElementLocation]:
+        if not resume.delete_element(element_id):
+            return None
+        return _locate(resume, element_id)
+
+    return await _update_element(storage, resume_name, update, if_match)
+
+
+@resume_router.post(
+    "/{resume_name}/elements/{element_id}/move", response_model=ElementResponse
+)
+async def move_resume_element(
+    resume_name: str,
+    element_id: str,
+    payload: MoveElementRequest,
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    """Move an element to another position within its collection."""
+
+    def update(resume: Resume) -> Optional[ElementLocation]:
+        if not resume.move_element(element_id, payload.index):
+            return None
+        return _locate(resume, element_id)
+
+    return await _update_element(storage, resume_name, update, if_match)
+
+
 @resume_router.post("/upload", response_model=ResumeUploadResponse)
 async def upload_resume(
-    file: UploadFile = File(...), storage: LocalDocumentStorage = Depends(get_storage)
+    file: UploadFile = File(...),
+    if_match: Optional[str] = Header(default=None),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
 ):
+    if not file.filename:
+        return JSONResponse(status_code=400, content={"message": "Missing file name"})
     content = await file.read()
-    storage.save_resume(content.decode("utf-8"), file.filename)
-    return ResumeUploadResponse(filename=file.filename, status="uploaded")
+    try:
+        revision = await storage.save_resume(
+            content.decode("utf-8"), file.filename, if_match
+        )
+    except ResumeVersionConflict as conflict:
+        return _conflict_response(conflict)
+    return ResumeUploadResponse(
+        filename=file.filename,
+        status="uploaded",
+        version=revision.version,
+        etag=revision.etag,
+    )
@@ -1,40 +1,36 @@
 import asyncio
-from fastapi.responses import JSONResponse
-from fastapi import APIRouter, Depends, Body, Response
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from pydantic import BaseModel, ValidationError
-from app.api.dependencies.dependencies import get_storage
-from app.core.storage import LocalDocumentStorage
-from typing import Dict, Literal, Optional, Any, List
-import os
-import re
-import yaml
+import base64
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Depends, Body, Request, Response
+from pydantic import BaseModel, Field
+from app.api.dependencies.dependencies import (
+    get_async_storage,
+    get_fragment_renderer,
+    get_render_pipeline,
+    get_render_workers,
+    get_template_index,
+)
+from app.core.preview import FragmentRenderer
+from app.core.batch import BatchItem, build_zip, expand_batch, render_batch
+from app.core.rendering import (
+    PreparedRender,
+    RenderArtifact,
+    RenderNotFound,
+    RenderPipeline,
+)
+from app.core.render_workers import RenderWorkerPool, RenderWorkerUtilization
+from app.core.storage import AsyncDocumentStorage
+from app.core.templates import TemplateIndex
+from app.models.resume import Resume
+from app.models.template import TemplateVariable
+from typing import Dict, Literal, Optional, Any, List, Union
 import logging
-from playwright.async_api import async_playwright
-import sys
 
 logger = logging.getLogger(__name__)
 
 template_router = APIRouter(prefix="/template", tags=["template"])
 
 
-class TemplateVariable(BaseModel):
-    type: Literal[
-        "text",
-        "select",
-        "multiselect",
-        "checkbox",
-        "bool",
-        "number",
-        "textarea",
-        "color",
-    ] = "text"
-    default: Optional[Any] = None
-    options: Optional[List[Any]] = None
-    label: Optional[str] = None
-    description: Optional[str] = None
-
-
 class ListTemplatesResponse(BaseModel):
     templates: list[str]
 
@@ -43,128 +39,312 @@ class RenderRequest(BaseModel):
     template_variables: Optional[Dict[str, Any]] = None
 
 
+class RenderBundleResponse(BaseModel):
+    artifact_id: str
+    content_hash: str
+    html: str
+    pdf_base64: str
+
+
+class PreviewRequest(BaseModel):
+    template_variables: Optional[Dict[str, Any]] = None
+    # unsaved edits; defaults to the stored resume
+    resume: Optional[Resume] = None
+    # what the client already shows: template hash and fragment name -> hash
+    template_hash: Optional[str] = None
+    fragments: Dict[str, str] = {}
+
+
+class PreviewFragmentResponse(BaseModel):
+    hash: str
+    html: str
+
+
+class PreviewResponse(BaseModel):
+    template_hash: str
+    fragments: Dict[str, PreviewFragmentResponse]
+    unchanged: List[str]
+    html: Optional[str] = None
+
+
+class RenderWorkersResponse(BaseModel):
+    enabled: bool
+    processes: int = 0
+    in_flight: int = 0
+    workers: List[RenderWorkerUtilization] = []
+
+
+class BatchRenderRequest(BaseModel):
+    items: List[BatchItem] = []
+    # every resume is rendered with every template; resumes default to all of them
+    resumes: Optional[List[str]] = None
+    templates: List[str] = []
+    template_variables: Optional[Dict[str, Any]] = None
+    pdf: bool = True
+    html: bool = False
+    format: Literal["ndjson", "zip"] = "ndjson"
+    concurrency: int = Field(default=4, ge=1, le=16)
+
+
+def _etag_response(request: Request, etag: str, content: Any) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(content=content, headers={"ETag": etag})
+
+
+def _artifact_response(
+    request: Request, artifact: RenderArtifact, content: bytes, media_type: str
+) -> Response:
+    if request.headers.get("if-none-match") == artifact.etag:
+        return Response(status_code=304, headers={"ETag": artifact.etag})
+    return Response(
+        content=content, media_type=media_type, headers={"ETag": artifact.etag}
+    )
+
+
 @template_router.get("/list", response_model=List[str])
-async def list_templates(storage: LocalDocumentStorage = Depends(get_storage)):
-    templates = storage.list_templates()
-    return templates
+async def list_templates(
+    request: Request, index: TemplateIndex = Depends(get_template_index)
+):
+    return _etag_response(request, index.list_etag, index.list_templates())
+
+
+@template_router.get("/workers", response_model=RenderWorkersResponse)
+async def get_render_workers_status(
+    workers: Optional[RenderWorkerPool] = Depends(get_render_workers),
+):
+    """Per-process utilization of the render worker pool, if enabled."""
+    if workers is None:
+        return RenderWorkersResponse(enabled=False)
+    return RenderWorkersResponse(
+        enabled=True,
+        processes=workers.processes,
+        in_flight=workers.in_flight,
+        workers=workers.utilization(),
+    )
 
 
 @template_router.get(
     "/{template_name}/variables", response_model=Dict[str, TemplateVariable]
 )
 async def get_template_variables(
-    template_name: str, storage: LocalDocumentStorage = Depends(get_storage)
+    template_name: str,
+    request: Request,
+    index: TemplateIndex = Depends(get_template_index),
 ):
-    path = os.path.join(storage.template_folder, template_name)
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
-    except FileNotFoundError:
+    metadata = index.get(template_name)
+    if metadata is None:
         return dict[str, TemplateVariable]()
 
-    front_matter_match = re.match(r"\s*---\s*\n(.*?)\n---\s*\n", text, re.S)
-    if not front_matter_match:
-        return dict[str, TemplateVariable]()
-    try:
-        front_matter: dict[str, Any] = yaml.safe_load(front_matter_match.group(1)) or {}
-        raw_vars: dict[str, Any] = front_matter.get("variables", {})
-
-        normalized: dict[str, TemplateVariable] = {}
-        for name, definition in raw_vars.items():
-            if not isinstance(definition, dict):
-                continue
-            try:
-                normalized[name] = TemplateVariable.model_validate(definition)
-            except ValidationError:
-                continue
-
-        return normalized
-    except Exception:
-        return dict[str, TemplateVariable]()
+    content = {
+        name: variable.model_dump(mode="json")
+        for name, variable in metadata.variables.items()
+    }
+    return _etag_response(request, metadata.etag, content)
+
+
+def _template_variables(payload: Optional[RenderRequest]) -> Optional[Dict[str, Any]]:
+    return payload.template_variables if payload else None
 
 
-def _render_template_to_html(
+async def _prepare_render(
+    request: Request,
+    pipeline: RenderPipeline,
     template_name: str,
     resume_name: str,
-    template_variables: Optional[Dict[str, Any]],
-    storage: LocalDocumentStorage,
-) -> str:
-    resume = storage.get_resume(resume_name=resume_name)
-    if not resume:
-        return ""
-
-    env = Environment(
-        loader=FileSystemLoader(storage.template_folder),
-        autoescape=select_autoescape(["html", "xml"]),
+    payload: Optional[RenderRequest],
+) -> Union[PreparedRender, Response]:
+    """
+    Resolve the render inputs, or the response to send instead: a 404, or a
+    304 when the client already has this render (checked before rendering).
+    """
+    prepared = await pipeline.prepare(
+        template_name, resume_name, _template_variables(payload)
     )
-
-    path = os.path.join(storage.template_folder, template_name)
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
-    except FileNotFoundError:
-        return ""
-    # remove leading YAML front-matter block between the first two --- lines
-    template_source = re.sub(r"^\s*---\s*\n(.*?)\n---\s*\n", "", text, flags=re.S)
-
-    if not template_source:
-        template = env.get_template(template_name)
-    else:
-        template = env.from_string(template_source)
-    render_context: Dict[str, Any] = {"resume": resume}
-    render_context["variables"] = template_variables or {}
-    return template.render(**render_context)
+    if isinstance(prepared, RenderNotFound):
+        return JSONResponse(status_code=404, content={"message": prepared.message})
+    if request.headers.get("if-none-match") == prepared.etag:
+        return Response(status_code=304, headers={"ETag": prepared.etag})
+    return prepared
 
 
 @template_router.post("/{template_name}/render/{resume_name}")
 async def render_template_endpoint(
     resume_name: str,
     template_name: str,
+    request: Request,
     payload: RenderRequest = Body(default=None),
-    storage: LocalDocumentStorage = Depends(get_storage),
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
 ):
-    resume = storage.get_resume(resume_name=resume_name)
-    if not resume:
-        return JSONResponse(status_code=404, content={"message": "Resume not found"})
+    prepared = await _prepare_render(
+        request, pipeline, template_name, resume_name, payload
+    )
+    if isinstance(prepared, Response):
+        return prepared
 
-    html = _render_template_to_html(
-        template_name,
-        resume_name,
-        payload.template_variables,
-        storage,
+    artifact = await pipeline.render_prepared(prepared, pdf=False)
+    return JSONResponse(
+        content={"html": artifact.html}, headers={"ETag": artifact.etag}
     )
-    return JSONResponse(content={"html": html})
 
 
-# TODO: it might make sense to implement an endpoint that returns both HTML and PDF together
 @template_router.post("/{template_name}/render/{resume_name}/pdf")
 async def render_template_pdf_endpoint(
     resume_name: str,
     template_name: str,
+    request: Request,
     payload: RenderRequest = Body(default=None),
-    storage: LocalDocumentStorage = Depends(get_storage),
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
 ):
-    if sys.platform.startswith("win"):
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    prepared = await _prepare_render(
+        request, pipeline, template_name, resume_name, payload
+    )
+    if isinstance(prepared, Response):
+        return prepared
+
+    artifact = await pipeline.render_prepared(prepared)
+    return Response(
+        content=artifact.pdf or b"",
+        media_type="application/pdf",
+        headers={"ETag": artifact.etag},
+    )
+
+
+@template_router.post(
+    "/{template_name}/render/{resume_name}/bundle", response_model=RenderBundleResponse
+)
+async def render_template_bundle_endpoint(
+    resume_name: str,
+    template_name: str,
+    request: Request,
+    payload: RenderRequest = Body(default=None),
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
+):
+    """
+    Render HTML and PDF in one pass. The resume is loaded and the template
+    rendered once; the result is kept as an artifact that can be downloaded
+    again through /template/artifacts/{artifact_id}. Unchanged inputs are
+    served from the render cache, and the artifact id doubles as the ETag.
+    """
+    prepared = await _prepare_render(
+        request, pipeline, template_name, resume_name, payload
+    )
+    if isinstance(prepared, Response):
+        return prepared
+
+    artifact = await pipeline.render_prepared(prepared)
+    bundle = RenderBundleResponse(
+        artifact_id=artifact.id,
+        content_hash=artifact.content_hash,
+        html=artifact.html,
+        pdf_base64=base64.b64encode(artifact.pdf or b"").decode("ascii"),
+    )
+    return JSONResponse(content=bundle.model_dump(), headers={"ETag": artifact.etag})
+
 
-    resume = storage.get_resume(resume_name=resume_name)
+@template_router.post(
+    "/{template_name}/preview/{resume_name}", response_model=PreviewResponse
+)
+async def preview_template_endpoint(
+    resume_name: str,
+    template_name: str,
+    payload: PreviewRequest = Body(default=None),
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
+    renderer: FragmentRenderer = Depends(get_fragment_renderer),
+):
+    """
+    Incremental HTML preview. Only the fragments (template sections, marked
+    with a `data-fragment` attribute) that changed since the hashes sent by
+    the client are returned, so the client can swap them in the DOM; the
+    whole document is returned as well when the client has none or an
+    outdated template.
+    """
+    payload = payload or PreviewRequest()
+    resume = payload.resume or await pipeline.load_resume(resume_name)
     if not resume:
         return JSONResponse(status_code=404, content={"message": "Resume not found"})
 
-    html_content = _render_template_to_html(
+    preview = await asyncio.to_thread(
+        renderer.render,
         template_name,
-        resume_name,
+        resume,
         payload.template_variables,
-        storage,
+        payload.fragments,
+        payload.template_hash,
+    )
+    if preview is None:
+        return JSONResponse(status_code=404, content={"message": "Template not found"})
+
+    return PreviewResponse(
+        template_hash=preview.template_hash,
+        fragments={
+            name: PreviewFragmentResponse(hash=fragment.hash, html=fragment.html)
+            for name, fragment in preview.fragments.items()
+        },
+        unchanged=preview.unchanged,
+        html=preview.html,
+    )
+
+
+@template_router.post("/batch")
+async def render_batch_endpoint(
+    payload: BatchRenderRequest,
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
+    storage: AsyncDocumentStorage = Depends(get_async_storage),
+):
+    """
+    Render many resume/template combinations concurrently. With the ndjson
+    format one result line (status, timing and artifact id) is streamed per
+    item as it completes; with the zip format the outputs are returned in an
+    archive together with a manifest.json of the results.
+    """
+    items = list(payload.items)
+    if payload.templates:
+        resumes = payload.resumes
+        if resumes is None:
+            resumes = await storage.list_resumes()
+        items += expand_batch(resumes, payload.templates, payload.template_variables)
+
+    outputs = render_batch(
+        pipeline, items, pdf=payload.pdf, concurrency=payload.concurrency
     )
+    if payload.format == "zip":
+        collected = [output async for output in outputs]
+        content = await asyncio.to_thread(build_zip, collected, payload.html)
+        return Response(
+            content=content,
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="renders.zip"'},
+        )
+
+    async def stream_results():
+        async for result, _ in outputs:
+            yield result.model_dump_json() + "\n"
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-        await page.set_content(
-            html_content, wait_until="networkidle"
-        )  # allow CSS/fonts to load
-        pdf_bytes = await page.pdf(format="A4", print_background=True)  # keep colors
-        await browser.close()
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
 
-    return Response(content=pdf_bytes, media_type="application/pdf")
+
+@template_router.get("/artifacts/{artifact_id}/html")
+async def get_artifact_html(
+    artifact_id: str,
+    request: Request,
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
+):
+    artifact = await asyncio.to_thread(pipeline.get_artifact, artifact_id)
+    if not artifact:
+        return JSONResponse(status_code=404, content={"message": "Artifact not found"})
+    return _artifact_response(
+        request, artifact, artifact.html.encode("utf-8"), "text/html"
+    )
+
+
+@template_router.get("/artifacts/{artifact_id}/pdf")
+async def get_artifact_pdf(
+    artifact_id: str,
+    request: Request,
+    pipeline: RenderPipeline = Depends(get_render_pipeline),
+):
+    artifact = await asyncio.to_thread(pipeline.get_artifact, artifact_id)
+    if not artifact or artifact.pdf is None:
+        return JSONResponse(status_code=404, content={"message": "Artifact not found"})
+    return _artifact_response(request, artifact, artifact.pdf, "application/pdf")
@@ -1,6 +1,9 @@
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+import httpx
+import threading
 from pydantic_settings import BaseSettings
 from google.oauth2 import service_account
 from pydantic_ai.models.google import GoogleModel
@@ -23,8 +26,37 @@ class ModelConfig(BaseSettings):
         env_file = ".env"
 
 
+@lru_cache()
+def get_http_client() -> httpx.AsyncClient:
+    """HTTP client shared by every model provider, so connections are pooled."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout=600, connect=5),
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+
+
+_models: Dict[str, Model] = {}
+_models_lock = threading.Lock()
+
+
 def get_model(config: Optional[ModelConfig] = None) -> Model:
+    """
+    Return the model for `config`, building it on first use.
+
+    Models are cached process-wide by configuration, so credentials are
+    loaded and providers are built once, and never at import time.
+    """
     config = config or ModelConfig()
+    key = config.model_dump_json()
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = _build_model(config)
+            _models[key] = model
+    return model
+
+
+def _build_model(config: ModelConfig) -> Model:
     if config.provider == ProviderName.google_vertex:
         credentials = None
         if config.credentials_file:
@@ -32,7 +64,11 @@ def get_model(config: Optional[ModelConfig] = None) -> Model:
                 str(config.credentials_file),
                 scopes=["https://www.googleapis.com/auth/cloud-platform"],
             )
-        provider = GoogleProvider(credentials=credentials, project=config.project_id)
+        provider = GoogleProvider(
+            credentials=credentials,
+            project=config.project_id,
+            http_client=get_http_client(),
+        )
         model = GoogleModel(config.model_name, provider=provider)
         return model
 
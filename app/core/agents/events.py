@@ -0,0 +1,77 @@
+from enum import Enum
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+from typing import Any, Dict, List, Optional
+import time
+
+
+class StreamConfig(BaseSettings):
+    flush_interval: float = 0.05
+
+    class Config:
+        env_prefix = "CHAT_STREAM_"
+        env_file = ".env"
+
+
+class StreamEventType(str, Enum):
+    text_delta = "text_delta"
+    tool_call_start = "tool_call_start"
+    tool_call_end = "tool_call_end"
+    subagent_start = "subagent_start"
+    subagent_end = "subagent_end"
+    usage = "usage"
+    done = "done"
+    error = "error"
+
+
+class StreamEvent(BaseModel):
+    """A single frame of the chat stream, sent as one NDJSON line."""
+
+    type: StreamEventType
+    timestamp: float = Field(default_factory=time.time)
+    elapsed_ms: float = 0.0
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+    def to_ndjson(self) -> str:
+        return self.model_dump_json() + "\n"
+
+
+class StreamEventFactory:
+    """Stamps events with wall-clock time and the time elapsed since the stream started."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+
+    def __call__(self, event_type: StreamEventType, **data: Any) -> StreamEvent:
+        return StreamEvent(
+            type=event_type,
+            elapsed_ms=(time.perf_counter() - self.started_at) * 1000,
+            data=data,
+        )
+
+
+class TextCoalescer:
+    """
+    Buffers text deltas and releases them at most once per `flush_interval`
+    seconds, so clients receive fewer, larger chunks.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._last_flush = time.perf_counter()
+
+    def add(self, text: str) -> Optional[str]:
+        """Buffer `text`; return the buffered text if a flush is due."""
+        self._buffer.append(text)
+        if time.perf_counter() - self._last_flush >= self.flush_interval:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[str]:
+        self._last_flush = time.perf_counter()
+        if not self._buffer:
+            return None
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        return text
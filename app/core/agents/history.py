@@ -0,0 +1,183 @@
+from pydantic_ai import Agent
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import Model
+from pydantic_settings import BaseSettings
+from app.core.memory import AsyncMemory, ConversationSummary
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_AGENT_PROMPT = (
+    "You maintain a running summary of a conversation between a user and ResuMate, "
+    "an assistant that helps with resumes. "
+    "Given the previous summary (if any) and the next part of the transcript, write an "
+    "updated summary that keeps every fact, decision, pending question and resume change "
+    "that later turns may rely on. Be concise and write plain prose."
+)
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+class HistoryConfig(BaseSettings):
+    enabled: bool = True
+    max_turns: int = 10
+    max_tokens: Optional[int] = 8000
+
+    class Config:
+        env_prefix = "HISTORY_"
+        env_file = ".env"
+
+
+def is_turn_start(message: ModelMessage) -> bool:
+    """A turn starts with the request carrying the user's prompt."""
+    return isinstance(message, ModelRequest) and any(
+        isinstance(part, UserPromptPart) for part in message.parts
+    )
+
+
+def estimate_tokens(message: ModelMessage) -> int:
+    """Rough token estimate (~4 characters per token) of a message's content."""
+    characters = 0
+    for part in message.parts:
+        if isinstance(part, ToolCallPart):
+            characters += len(part.args_as_json_str())
+        else:
+            characters += len(str(getattr(part, "content", "") or ""))
+    return characters // 4 + 1
+
+
+def format_transcript(messages: List[ModelMessage]) -> str:
+    lines: List[str] = []
+    for message in messages:
+        for part in message.parts:
+            if isinstance(part, UserPromptPart):
+                lines.append(f"User: {part.content}")
+            elif isinstance(part, TextPart):
+                lines.append(f"Assistant: {part.content}")
+            elif isinstance(part, ToolCallPart):
+                lines.append(
+                    f"Assistant called {part.tool_name}({part.args_as_json_str()})"
+                )
+    return "\n".join(lines)
+
+
+class HistoryCompactor:
+    """
+    Keeps the history sent to the model within a turn and token budget.
+
+    The last turns are passed through untouched; older turns are replaced by
+    a rolling summary. The summary is stored in memory together with the
+    number of messages it covers and is updated after each turn, off the
+    critical path, with only the messages that have just left the window.
+    """
+
+    def __init__(self, config: Optional[HistoryConfig] = None):
+        self.config = config or HistoryConfig()
+        self.summarizer: Agent[None, str] = Agent(system_prompt=SUMMARY_AGENT_PROMPT)
+
+    def _window_start(self, messages: List[ModelMessage]) -> int:
+        turn_starts = [
+            i for i, message in enumerate(messages) if is_turn_start(message)
+        ]
+        if not turn_starts:
+            return 0
+
+        kept_turns = turn_starts[-self.config.max_turns :]
+        if self.config.max_tokens is not None:
+            # drop whole turns until the window fits, always keeping the last one
+            tokens = [estimate_tokens(message) for message in messages]
+            while (
+                len(kept_turns) > 1
+                and sum(tokens[kept_turns[0] :]) > self.config.max_tokens
+            ):
+                kept_turns = kept_turns[1:]
+        return kept_turns[0]
+
+    async def compact(
+        self, conversation_id: str, messages: List[ModelMessage], memory: AsyncMemory
+    ) -> List[ModelMessage]:
+        """
+        Replace the messages covered by the stored summary with the summary.
+        Turns that left the window but aren't summarized yet are sent as they
+        are until `update_summary` catches up, so no model call is made here.
+        """
+        if not self.config.enabled:
+            return messages
+
+        summary = await self._stored_summary(conversation_id, messages, memory)
+        if summary is None:
+            return messages
+
+        system_parts = [
+            part for part in messages[0].parts if isinstance(part, SystemPromptPart)
+        ]
+        head = ModelRequest(
+            parts=[
+                *system_parts,
+                SystemPromptPart(content=SUMMARY_PREFIX + summary.content),
+            ]
+        )
+        return [head, *messages[summary.message_count :]]
+
+    async def update_summary(
+        self,
+        conversation_id: str,
+        messages: List[ModelMessage],
+        memory: AsyncMemory,
+        model: Model,
+    ):
+        """
+        Fold the turns that have left the window into the stored summary, for
+        the next turn to use. Failures are logged and leave the summary as is.
+        """
+        if not self.config.enabled:
+            return
+
+        summary = await self._stored_summary(conversation_id, messages, memory)
+        covered = summary.message_count if summary else 0
+        window_start = self._window_start(messages)
+        if window_start <= covered:
+            return
+
+        try:
+            summary = await self._summarize(
+                summary, messages[covered:window_start], window_start, model
+            )
+        except Exception:
+            logger.warning(
+                "Failed to summarize conversation %s", conversation_id, exc_info=True
+            )
+            return
+        await memory.set_summary(conversation_id, summary)
+
+    @staticmethod
+    async def _stored_summary(
+        conversation_id: str, messages: List[ModelMessage], memory: AsyncMemory
+    ) -> Optional[ConversationSummary]:
+        summary = await memory.get_summary(conversation_id)
+        if summary and summary.message_count > len(messages):
+            return None
+        return summary
+
+    async def _summarize(
+        self,
+        previous: Optional[ConversationSummary],
+        messages: List[ModelMessage],
+        message_count: int,
+        model: Model,
+    ) -> ConversationSummary:
+        prompt = (
+            f"Previous summary:\n{previous.content if previous else '(none)'}\n\n"
+            f"Next part of the transcript:\n{format_transcript(messages)}"
+        )
+        result = await self.summarizer.run(prompt, model=model)
+        logger.debug("Summarized %d messages", len(messages))
+        return ConversationSummary(content=result.output, message_count=message_count)
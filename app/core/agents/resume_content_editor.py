@@ -1,4 +1,3 @@
-from app.core.agents.builder import get_model, ModelConfig
 from app.core.agents.common import SupervisorRuntimeContext
 from app.models.resume import ResumeElement
 from pydantic_ai import Agent, RunContext, Tool
@@ -42,14 +41,20 @@ def edit_resume_content(
     """
     if not context.deps.resume_name:
         return "No resume selected."
-    resume = context.deps.document_storage.get_resume(context.deps.resume_name)
-    if resume.update_element_by_id(element_id, new_content):
+    try:
+        updated, _ = context.deps.document_storage.update_resume(
+            context.deps.resume_name,
+            lambda resume: resume.update_element_by_id(element_id, new_content),
+        )
+    except TypeError as e:
+        return f"Failed to update resume content: {e}."
+    if updated:
         return "Resume content updated successfully."
     return "Failed to update resume content."
 
 
+# the model is supplied per run by the delegating agent, see resume_content_editor_tool
 resume_content_editor_agent = Agent(
-    get_model(ModelConfig()),
     deps_type=SupervisorRuntimeContext,
     tools=[
         Tool(edit_resume_content, takes_ctx=True),
@@ -79,7 +84,10 @@ async def resume_content_editor_tool(
     if not context.deps.resume_name:
         return "No resume selected."
     result = await resume_content_editor_agent.run(
-        user_prompt=request, deps=context.deps, usage=context.usage
+        user_prompt=request,
+        deps=context.deps,
+        usage=context.usage,
+        model=context.model,
     )
 
     return result.output
@@ -1,11 +1,29 @@
 from app.core.agents.builder import get_model, ModelConfig
-from pydantic_ai import Agent, RunContext, Tool, ModelMessagesTypeAdapter
+from app.core.agents.history import HistoryCompactor, HistoryConfig
+from app.core.agents.events import (
+    StreamConfig,
+    StreamEventFactory,
+    StreamEventType,
+    TextCoalescer,
+)
+from pydantic_ai import Agent, RunContext, Tool
+from pydantic_ai.messages import (
+    FunctionToolCallEvent,
+    FunctionToolResultEvent,
+    ModelMessage,
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+)
+from pydantic_ai.models import Model
 from pydantic_core import to_jsonable_python
-from app.core.memory import LocalMemory
+from app.core.memory import AsyncMemory
 from app.core.storage import LocalDocumentStorage
 from app.core.agents.common import SupervisorRuntimeContext
 from app.core.agents.resume_content_editor import resume_content_editor_tool
-from typing import AsyncGenerator, List, Dict, Optional
+from typing import AsyncGenerator, Dict, List, Optional, Set
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,6 +41,10 @@ SUPERVISOR_AGENT_PROMPT = (
 )
 
 
+# tools that delegate to another agent, reported as sub-agent activity
+SUBAGENT_TOOLS = {resume_content_editor_tool.__name__}
+
+
 def list_resumes_tool(context: RunContext[SupervisorRuntimeContext]) -> str:
     """
     Tool to list all resumes available in the system.
@@ -39,11 +61,16 @@ class ResuMateSupervisore:
         self,
         config: ModelConfig | None = None,
         document_storage: LocalDocumentStorage | None = None,
+        history_config: HistoryConfig | None = None,
+        stream_config: StreamConfig | None = None,
     ):
-        self.model = get_model(config)
-        self.document_storage = document_storage
+        self.config = config or ModelConfig()
+        self.history_compactor = HistoryCompactor(history_config)
+        self.stream_config = stream_config or StreamConfig()
+        self.document_storage = document_storage or LocalDocumentStorage()
+        # summary updates still running; referenced so they aren't collected
+        self._background_tasks: Set[asyncio.Task] = set()
         self.agent: Agent[SupervisorRuntimeContext] = Agent(
-            self.model,
             deps_type=SupervisorRuntimeContext,
             system_prompt=SUPERVISOR_AGENT_PROMPT,
             tools=[
@@ -52,29 +79,120 @@ class ResuMateSupervisore:
             ],
         )
 
-    # TODO: Handle message chunks properly instead of yielding raw strings
+    @property
+    def model(self) -> Model:
+        """The supervisor's model, built lazily on first use."""
+        return get_model(self.config)
+
     async def stream(
         self,
         user_prompt: str,
-        message_history: List[Dict[str, str]],
-        memory: LocalMemory,
+        message_history: List[ModelMessage],
+        memory: AsyncMemory,
         conversation_id: str,
         resume_name: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
-        message_history_adapter = ModelMessagesTypeAdapter.validate_python(
-            message_history
+        """
+        Run the supervisor and yield the response as NDJSON StreamEvent lines:
+        coalesced text deltas, tool and sub-agent activity, usage and a final
+        done (or error) event.
+        """
+        make_event = StreamEventFactory()
+        coalescer = TextCoalescer(self.stream_config.flush_interval)
+        tool_names: Dict[str, str] = {}
+
+        def text_event(text: Optional[str]) -> Optional[str]:
+            if not text:
+                return None
+            return make_event(StreamEventType.text_delta, text=text).to_ndjson()
+
+        try:
+            model = self.model
+            compacted_history = await self.history_compactor.compact(
+                conversation_id, message_history, memory
+            )
+            async with self.agent.iter(
+                user_prompt=user_prompt,
+                message_history=compacted_history,
+                model=model,
+                deps=SupervisorRuntimeContext(
+                    document_storage=self.document_storage, resume_name=resume_name
+                ),
+            ) as run:
+                async for node in run:
+                    if Agent.is_model_request_node(node):
+                        async with node.stream(run.ctx) as request_stream:
+                            async for event in request_stream:
+                                text = None
+                                if isinstance(event, PartStartEvent) and isinstance(
+                                    event.part, TextPart
+                                ):
+                                    text = event.part.content
+                                elif isinstance(event, PartDeltaEvent) and isinstance(
+                                    event.delta, TextPartDelta
+                                ):
+                                    text = event.delta.content_delta
+                                if text and (chunk := text_event(coalescer.add(text))):
+                                    yield chunk
+                    elif Agent.is_call_tools_node(node):
+                        async with node.stream(run.ctx) as tools_stream:
+                            async for event in tools_stream:
+                                if chunk := text_event(coalescer.flush()):
+                                    yield chunk
+                                if isinstance(event, FunctionToolCallEvent):
+                                    tool_name = event.part.tool_name
+                                    tool_names[event.part.tool_call_id] = tool_name
+                                    yield make_event(
+                                        self._tool_event_type(tool_name, start=True),
+                                        tool_name=tool_name,
+                                        tool_call_id=event.part.tool_call_id,
+                                    ).to_ndjson()
+                                elif isinstance(event, FunctionToolResultEvent):
+                                    tool_name = tool_names.get(event.tool_call_id, "")
+                                    yield make_event(
+                                        self._tool_event_type(tool_name, start=False),
+                                        tool_name=tool_name,
+                                        tool_call_id=event.tool_call_id,
+                                    ).to_ndjson()
+
+                if chunk := text_event(coalescer.flush()):
+                    yield chunk
+                if run.result is not None:
+                    new_messages = run.result.new_messages()
+                    await memory.add_messages(
+                        conversation_id=conversation_id, messages=new_messages
+                    )
+                    self._update_summary(
+                        conversation_id, [*message_history, *new_messages], memory
+                    )
+                yield make_event(
+                    StreamEventType.usage, **to_jsonable_python(run.usage())
+                ).to_ndjson()
+            yield make_event(StreamEventType.done).to_ndjson()
+        except Exception as e:
+            logger.exception("Chat stream failed")
+            yield make_event(StreamEventType.error, message=str(e)).to_ndjson()
+
+    def _update_summary(
+        self, conversation_id: str, messages: List[ModelMessage], memory: AsyncMemory
+    ):
+        """Update the history summary in the background, for the next turn."""
+        task = asyncio.create_task(
+            self.history_compactor.update_summary(
+                conversation_id, messages, memory, self.model
+            )
         )
-        async with self.agent.run_stream(
-            user_prompt=user_prompt,
-            message_history=message_history_adapter,
-            deps=SupervisorRuntimeContext(
-                document_storage=self.document_storage, resume_name=resume_name
-            ),
-        ) as response:
-            async for text in response.stream_text(delta=True):
-                yield text
-            messages = response.new_messages()
-            messages_python = to_jsonable_python(messages)
-            memory.add_messages(
-                conversation_id=conversation_id, messages=messages_python
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    @staticmethod
+    def _tool_event_type(tool_name: str, start: bool) -> StreamEventType:
+        if tool_name in SUBAGENT_TOOLS:
+            return (
+                StreamEventType.subagent_start
+                if start
+                else StreamEventType.subagent_end
             )
+        return (
+            StreamEventType.tool_call_start if start else StreamEventType.tool_call_end
+        )
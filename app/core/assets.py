@@ -0,0 +1,200 @@
+from functools import lru_cache
+from app.models.link import set_icon_resolver
+from typing import Dict, List, Optional, Tuple
+import base64
+import io
+import logging
+import mimetypes
+import os
+import re
+import threading
+import time
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, icons are then embedded as-is
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# icons are displayed at ~14px; keep enough pixels for sharp high-DPI prints
+ICON_SIZE = 64
+
+
+class IconRegistry:
+    """
+    Cache of icon files encoded as data URIs.
+
+    Each (path, max_size) variant is read and encoded once and kept until the
+    file's mtime changes. The mtime is checked at most every `check_interval`
+    seconds, so repeated lookups are plain dictionary hits.
+    """
+
+    def __init__(self, base_folder: str = "documents", check_interval: float = 2.0):
+        self.base_folder = base_folder
+        self.check_interval = check_interval
+        # (absolute path, max_size) -> (mtime_ns, last check, data uri)
+        self._cache: Dict[Tuple[str, Optional[int]], Tuple[int, float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get_data_uri(
+        self, rel_path: str, max_size: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Return the icon at `rel_path` (relative to the base folder) as a data
+        URI, downscaled to fit in `max_size` pixels if given. Returns None if
+        the file can't be read.
+        """
+        path = os.path.abspath(os.path.join(self.base_folder, rel_path))
+        key = (path, max_size)
+        now = time.monotonic()
+
+        cached = self._cache.get(key)
+        if cached and now - cached[1] < self.check_interval:
+            return cached[2]
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        if cached and cached[0] == mtime_ns:
+            with self._lock:
+                self._cache[key] = (mtime_ns, now, cached[2])
+            return cached[2]
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        mime = _guess_mime(path)
+        if max_size is not None:
+            data, mime = _downscale(data, mime, max_size)
+
+        data_uri = _data_uri(data, mime)
+        with self._lock:
+            self._cache[key] = (mtime_ns, now, data_uri)
+        return data_uri
+
+
+def _guess_mime(path: str) -> str:
+    mime, _ = mimetypes.guess_type(path)
+    return mime or "application/octet-stream"
+
+
+def _data_uri(data: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+STYLESHEET_PATTERN = re.compile(
+    r"<link\b[^>]*\brel=[\"']?stylesheet[\"']?[^>]*>", re.IGNORECASE
+)
+HREF_PATTERN = re.compile(r"\bhref=([\"'])([^\"']+)\1", re.IGNORECASE)
+SRC_PATTERN = re.compile(
+    r"(<(?:img|source|image|video|audio)\b[^>]*?\bsrc=)([\"'])([^\"']+)\2",
+    re.IGNORECASE,
+)
+CSS_URL_PATTERN = re.compile(r"url\(\s*([\"']?)([^\"')]+)\1\s*\)", re.IGNORECASE)
+EXTERNAL_REFERENCE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", re.IGNORECASE)
+
+
+class AssetInliner:
+    """
+    Rewrites static asset references of a template into inline content:
+    stylesheets become <style> blocks, and images and CSS url()s (fonts,
+    backgrounds) become data URIs. References are resolved against `folders`,
+    in order, and must stay inside them; dynamic (Jinja) and remote
+    references are left untouched.
+    """
+
+    def __init__(self, folders: List[str]):
+        self.folders = [os.path.abspath(folder) for folder in folders]
+
+    def inline(self, source: str) -> Tuple[str, Dict[str, int]]:
+        """Return the inlined source and the mtime_ns of every file that was inlined."""
+        used: Dict[str, int] = {}
+
+        def replace_stylesheet(match: "re.Match[str]") -> str:
+            href = HREF_PATTERN.search(match.group(0))
+            path = self._resolve(href.group(2) if href else "", self.folders)
+            if path is None:
+                return match.group(0)
+            css = self._read(path, used).decode("utf-8")
+            css = self._inline_css(css, [os.path.dirname(path), *self.folders], used)
+            # raw, so CSS can't be mistaken for Jinja syntax
+            return f"<style>{{% raw %}}{css}{{% endraw %}}</style>"
+
+        def replace_src(match: "re.Match[str]") -> str:
+            path = self._resolve(match.group(3), self.folders)
+            if path is None:
+                return match.group(0)
+            data_uri = _data_uri(self._read(path, used), _guess_mime(path))
+            return f"{match.group(1)}{match.group(2)}{data_uri}{match.group(2)}"
+
+        source = STYLESHEET_PATTERN.sub(replace_stylesheet, source)
+        source = SRC_PATTERN.sub(replace_src, source)
+        source = self._inline_css(source, self.folders, used)
+        return source, used
+
+    def _inline_css(self, css: str, folders: List[str], used: Dict[str, int]) -> str:
+        def replace_url(match: "re.Match[str]") -> str:
+            path = self._resolve(match.group(2), folders)
+            if path is None:
+                return match.group(0)
+            data_uri = _data_uri(self._read(path, used), _guess_mime(path))
+            return f"url({match.group(1)}{data_uri}{match.group(1)})"
+
+        return CSS_URL_PATTERN.sub(replace_url, css)
+
+    def _resolve(self, reference: str, folders: List[str]) -> Optional[str]:
+        reference = reference.strip()
+        if (
+            not reference
+            or "{{" in reference
+            or "{%" in reference
+            or EXTERNAL_REFERENCE.match(reference)
+        ):
+            return None
+        reference = reference.split("?", 1)[0].split("#", 1)[0].lstrip("/")
+        for folder in folders:
+            path = os.path.abspath(os.path.join(folder, reference))
+            inside = any(path.startswith(root + os.sep) for root in self.folders)
+            if inside and os.path.isfile(path):
+                return path
+        return None
+
+    def _read(self, path: str, used: Dict[str, int]) -> bytes:
+        used[path] = os.stat(path).st_mtime_ns
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def _downscale(data: bytes, mime: str, max_size: int) -> Tuple[bytes, str]:
+    """Shrink an image to fit in max_size x max_size and re-encode it as an optimized PNG."""
+    if Image is None or not mime.startswith("image/"):
+        return data, mime
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if max(image.size) <= max_size:
+                return data, mime
+            image.thumbnail((max_size, max_size))
+            output = io.BytesIO()
+            image.save(output, format="PNG", optimize=True)
+    except Exception:
+        # corrupt, unsupported or oversized images are embedded as they are
+        logger.warning("Failed to downscale an icon", exc_info=True)
+        return data, mime
+    return output.getvalue(), "image/png"
+
+
+@lru_cache()
+def get_icon_registry() -> IconRegistry:
+    return IconRegistry()
+
+
+def icon_data_uri(rel_path: str, max_size: int = ICON_SIZE) -> Optional[str]:
+    """Cached, downscaled data URI of an icon (path relative to the documents folder)."""
+    return get_icon_registry().get_data_uri(rel_path, max_size)
+
+
+set_icon_resolver(icon_data_uri)
@@ -0,0 +1,158 @@
+from collections import Counter
+from enum import Enum
+from pydantic import BaseModel
+from app.core.rendering import RenderArtifact, RenderNotFound, RenderPipeline
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import io
+import json
+import logging
+import os
+import time
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+
+class BatchItem(BaseModel):
+    resume_name: str
+    template_name: str
+    template_variables: Optional[Dict[str, Any]] = None
+
+
+class BatchItemStatus(str, Enum):
+    ok = "ok"
+    not_found = "not_found"
+    error = "error"
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    resume_name: str
+    template_name: str
+    status: BatchItemStatus
+    # output path without extension, unique within the batch
+    path: str = ""
+    artifact_id: Optional[str] = None
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+
+BatchOutput = Tuple[BatchItemResult, Optional[RenderArtifact]]
+
+
+def expand_batch(
+    resume_names: List[str],
+    template_names: List[str],
+    template_variables: Optional[Dict[str, Any]] = None,
+) -> List[BatchItem]:
+    """Every resume rendered with every template."""
+    return [
+        BatchItem(
+            resume_name=resume_name,
+            template_name=template_name,
+            template_variables=template_variables,
+        )
+        for resume_name in resume_names
+        for template_name in template_names
+    ]
+
+
+def output_paths(items: List[BatchItem]) -> List[str]:
+    """
+    Output path of each item without extension, e.g. `Jane Doe/modern`.
+    Items rendering the same resume with the same template (with different
+    variables) get their index appended, e.g. `Jane Doe/modern-3`.
+    """
+    paths = [
+        f"{os.path.splitext(item.resume_name)[0]}/{item.template_name.split('.', 1)[0]}"
+        for item in items
+    ]
+    counts = Counter(paths)
+    return [
+        f"{path}-{index}" if counts[path] > 1 else path
+        for index, path in enumerate(paths)
+    ]
+
+
+def output_path(item: BatchItemResult, extension: str) -> str:
+    """Relative path of a batch output, e.g. `Jane Doe/modern.pdf`."""
+    return f"{item.path}.{extension}"
+
+
+async def render_batch(
+    pipeline: RenderPipeline,
+    items: List[BatchItem],
+    pdf: bool = True,
+    concurrency: int = 4,
+) -> AsyncIterator[BatchOutput]:
+    """
+    Render every item with at most `concurrency` renders in flight, yielding
+    results in completion order. A failing item is reported in its result and
+    doesn't stop the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    paths = output_paths(items)
+
+    async def run(index: int, item: BatchItem) -> BatchOutput:
+        async with semaphore:
+            started = time.perf_counter()
+            artifact = None
+            error = None
+            try:
+                rendered = await pipeline.render(
+                    item.template_name,
+                    item.resume_name,
+                    item.template_variables,
+                    pdf=pdf,
+                )
+                if isinstance(rendered, RenderNotFound):
+                    status = BatchItemStatus.not_found
+                    error = rendered.message
+                else:
+                    artifact = rendered
+                    status = BatchItemStatus.ok
+            except Exception as e:
+                logger.exception("Batch item %d failed", index)
+                status = BatchItemStatus.error
+                error = str(e)
+
+            result = BatchItemResult(
+                index=index,
+                resume_name=item.resume_name,
+                template_name=item.template_name,
+                status=status,
+                path=paths[index],
+                artifact_id=artifact.id if artifact else None,
+                elapsed_ms=(time.perf_counter() - started) * 1000,
+                error=error,
+            )
+            return result, artifact
+
+    tasks = [asyncio.create_task(run(i, item)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def build_zip(outputs: List[BatchOutput], html: bool = False) -> bytes:
+    """Zip the rendered PDFs (and HTML if requested) with a manifest.json of every result."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for result, artifact in outputs:
+            if artifact is None:
+                continue
+            if artifact.pdf is not None:
+                archive.writestr(output_path(result, "pdf"), artifact.pdf)
+            if html:
+                archive.writestr(output_path(result, "html"), artifact.html)
+
+        manifest = [
+            result.model_dump(mode="json")
+            for result, _ in sorted(outputs, key=lambda output: output[0].index)
+        ]
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+    return buffer.getvalue()
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from pydantic_settings import BaseSettings
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolConfig(BaseSettings):
+    warm_contexts: int = 2
+    max_concurrency: int = 4
+    health_check_interval: float = 30.0
+
+    class Config:
+        env_prefix = "BROWSER_POOL_"
+        env_file = ".env"
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium instance shared by every PDF render.
+
+    The browser is launched once, a number of browser contexts are kept warm
+    and handed out to callers, and the number of concurrently open pages is
+    capped. A background task checks the browser periodically and relaunches
+    it if it crashed or got disconnected.
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None):
+        self.config = config or BrowserPoolConfig()
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: asyncio.Queue[BrowserContext] = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        self._lock = asyncio.Lock()
+        self._health_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def start(self):
+        try:
+            await self._ensure_browser()
+        except Exception:
+            # Keep the API usable without Chromium; the next render retries.
+            logger.exception("Failed to start the browser pool")
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        async with self._lock:
+            await self._close_browser()
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Yield a fresh page from a warm context, respecting the concurrency limit."""
+        async with self._semaphore:
+            await self._ensure_browser()
+            context = await self._acquire_context()
+            page: Optional[Page] = None
+            healthy = True
+            try:
+                page = await context.new_page()
+                yield page
+            except PlaywrightError:
+                healthy = False
+                raise
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except PlaywrightError:
+                        healthy = False
+                await self._release_context(context, healthy)
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.config.health_check_interval)
+            try:
+                await self._ensure_browser()
+            except Exception:
+                logger.exception("Browser pool health check failed")
+
+    async def _ensure_browser(self):
+        if self.is_running:
+            return
+        async with self._lock:
+            if self.is_running:
+                return
+            if self._browser is not None:
+                logger.warning("Browser disconnected, restarting it")
+            await self._close_browser()
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch()
+            for _ in range(self.config.warm_contexts):
+                self._contexts.put_nowait(await self._browser.new_context())
+            logger.info(
+                "Browser pool started with %d warm contexts",
+                self.config.warm_contexts,
+            )
+
+    async def _close_browser(self):
+        while not self._contexts.empty():
+            context = self._contexts.get_nowait()
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except PlaywrightError:
+                pass
+            self._browser = None
+
+    async def _acquire_context(self) -> BrowserContext:
+        try:
+            return self._contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            assert self._browser is not None
+            return await self._browser.new_context()
+
+    async def _release_context(self, context: BrowserContext, healthy: bool):
+        keep = (
+            healthy
+            and self.is_running
+            and context.browser is self._browser
+            and self._contexts.qsize() < self.config.warm_contexts
+        )
+        if keep:
+            self._contexts.put_nowait(context)
+            return
+        try:
+            await context.close()
+        except PlaywrightError:
+            pass
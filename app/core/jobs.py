@@ -0,0 +1,250 @@
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings
+from app.core.rendering import (
+    RenderArtifact,
+    RenderNotFound,
+    RenderPipeline,
+    RenderResult,
+)
+from typing import Any, Deque, Dict, List, Optional
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class RenderJobConfig(BaseSettings):
+    workers: int = 2
+    max_finished_jobs: int = 64
+
+    class Config:
+        env_prefix = "RENDER_JOBS_"
+        env_file = ".env"
+
+
+class JobPriority(str, Enum):
+    interactive = "interactive"
+    batch = "batch"
+
+
+# lower runs first
+PRIORITY_ORDER = {JobPriority.interactive: 0, JobPriority.batch: 1}
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+FINISHED_STATUSES = {JobStatus.done, JobStatus.failed, JobStatus.cancelled}
+
+
+class RenderJobInfo(BaseModel):
+    id: str
+    template_name: str
+    resume_name: str
+    priority: JobPriority
+    status: JobStatus
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    artifact_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class RenderJobMetrics(BaseModel):
+    workers: int
+    queue_depth: Dict[JobPriority, int]
+    running: int
+    completed: int
+    failed: int
+    cancelled: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+@dataclass
+class RenderJob:
+    template_name: str
+    resume_name: str
+    template_variables: Optional[Dict[str, Any]]
+    priority: JobPriority
+    pdf: bool = True
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.queued
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    artifact: Optional[RenderArtifact] = None
+    error: Optional[str] = None
+    task: Optional["asyncio.Task[RenderResult]"] = None
+    # set by RenderJobQueue.cancel, to tell it apart from the queue stopping
+    cancel_requested: bool = False
+
+    def info(self) -> RenderJobInfo:
+        return RenderJobInfo(
+            id=self.id,
+            template_name=self.template_name,
+            resume_name=self.resume_name,
+            priority=self.priority,
+            status=self.status,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            artifact_id=self.artifact.id if self.artifact else None,
+            error=self.error,
+        )
+
+
+class RenderJobQueue:
+    """
+    Background render jobs run by a fixed number of workers.
+
+    Jobs are taken from a priority queue, interactive previews ahead of batch
+    exports and in submission order within a priority. Finished jobs keep
+    their artifact until `max_finished_jobs` newer jobs have finished.
+    """
+
+    def __init__(
+        self,
+        pipeline: RenderPipeline,
+        config: Optional[RenderJobConfig] = None,
+    ):
+        self.pipeline = pipeline
+        self.config = config or RenderJobConfig()
+        self._queue: asyncio.PriorityQueue[tuple[int, int, str]] = (
+            asyncio.PriorityQueue()
+        )
+        self._sequence = itertools.count()
+        self._jobs: Dict[str, RenderJob] = {}
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self._workers: List[asyncio.Task[None]] = []
+        self._waits: Deque[float] = deque(maxlen=256)
+        self._counts = {status: 0 for status in FINISHED_STATUSES}
+
+    async def start(self):
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.config.workers)
+        ]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(
+        self,
+        template_name: str,
+        resume_name: str,
+        template_variables: Optional[Dict[str, Any]] = None,
+        priority: JobPriority = JobPriority.interactive,
+        pdf: bool = True,
+    ) -> RenderJob:
+        job = RenderJob(
+            template_name=template_name,
+            resume_name=resume_name,
+            template_variables=template_variables,
+            priority=priority,
+            pdf=pdf,
+        )
+        self._jobs[job.id] = job
+        self._queue.put_nowait((PRIORITY_ORDER[priority], next(self._sequence), job.id))
+        return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; returns False if it had already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return False
+        job.cancel_requested = True
+        if job.status == JobStatus.running and job.task is not None:
+            job.task.cancel()  # the worker finishes the job
+        else:
+            self._finish(job, JobStatus.cancelled)
+        return True
+
+    def metrics(self) -> RenderJobMetrics:
+        queue_depth = {priority: 0 for priority in JobPriority}
+        running = 0
+        for job in self._jobs.values():
+            if job.status == JobStatus.queued:
+                queue_depth[job.priority] += 1
+            elif job.status == JobStatus.running:
+                running += 1
+        waits = list(self._waits)
+        return RenderJobMetrics(
+            workers=len(self._workers),
+            queue_depth=queue_depth,
+            running=running,
+            completed=self._counts[JobStatus.done],
+            failed=self._counts[JobStatus.failed],
+            cancelled=self._counts[JobStatus.cancelled],
+            avg_wait_ms=sum(waits) / len(waits) if waits else 0.0,
+            max_wait_ms=max(waits, default=0.0),
+        )
+
+    async def _worker(self):
+        while True:
+            _, _, job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.queued:
+                continue  # cancelled while queued
+
+            job.status = JobStatus.running
+            job.started_at = time.time()
+            self._waits.append((job.started_at - job.submitted_at) * 1000)
+            job.task = asyncio.create_task(
+                self.pipeline.render(
+                    job.template_name,
+                    job.resume_name,
+                    job.template_variables,
+                    pdf=job.pdf,
+                )
+            )
+            try:
+                result = await job.task
+            except asyncio.CancelledError:
+                # cancelling the worker cancels the awaited task too, so only
+                # the flag tells a cancelled job from the queue stopping
+                job.task.cancel()
+                self._finish(job, JobStatus.cancelled)
+                current = asyncio.current_task()
+                if not job.cancel_requested or (current and current.cancelling()):
+                    raise
+            except Exception as e:
+                logger.exception("Render job %s failed", job.id)
+                job.error = str(e)
+                self._finish(job, JobStatus.failed)
+            else:
+                if isinstance(result, RenderNotFound):
+                    job.error = result.message
+                    self._finish(job, JobStatus.failed)
+                else:
+                    job.artifact = result
+                    self._finish(job, JobStatus.done)
+            finally:
+                job.task = None
+
+    def _finish(self, job: RenderJob, status: JobStatus):
+        job.status = status
+        job.finished_at = time.time()
+        self._counts[status] += 1
+        self._finished[job.id] = None
+        while len(self._finished) > self.config.max_finished_jobs:
+            expired_id, _ = self._finished.popitem(last=False)
+            self._jobs.pop(expired_id, None)
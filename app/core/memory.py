@@ -1,22 +1,441 @@
-from typing import Dict, List
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pydantic_ai import ModelMessagesTypeAdapter
+from pydantic_ai.messages import ModelMessage
+from pydantic_settings import BaseSettings
+from typing import Any, Dict, List, Literal, Optional
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
 
 
-class LocalMemory:
+class MemoryConfig(BaseSettings):
+    backend: Literal["local", "sqlite"] = "sqlite"
+    sqlite_path: str = "documents/memory.db"
+    ttl_seconds: Optional[float] = 30 * 24 * 60 * 60
+    max_conversations: Optional[int] = 1000
+    cache_size: int = 64
+
+    class Config:
+        env_prefix = "MEMORY_"
+        env_file = ".env"
+
+
+@dataclass
+class ConversationSummary:
+    """Rolling summary of the first `message_count` messages of a conversation."""
+
+    content: str
+    message_count: int
+
+
+class StoredMessage:
+    """
+    A conversation message kept both as a validated ModelMessage and as its
+    JSON form. Each representation is computed lazily, at most once.
+    """
+
+    __slots__ = ("_message", "_payload")
+
+    def __init__(
+        self,
+        message: Optional[ModelMessage] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ):
+        if message is None and payload is None:
+            raise ValueError("Either message or payload is required")
+        self._message = message
+        self._payload = payload
+
+    @property
+    def message(self) -> ModelMessage:
+        if self._message is None:
+            self._message = ModelMessagesTypeAdapter.validate_python([self._payload])[0]
+        return self._message
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        if self._payload is None:
+            self._payload = ModelMessagesTypeAdapter.dump_python(
+                [self.message], mode="json"
+            )[0]
+        return self._payload
+
+
+class BaseMemory(ABC):
+    @abstractmethod
+    def get_records(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[StoredMessage]: ...
+
+    @abstractmethod
+    def add_messages(self, conversation_id: str, messages: List[ModelMessage]): ...
+
+    @abstractmethod
+    def set_conversation(self, conversation_id: str, messages: List[ModelMessage]): ...
+
+    @abstractmethod
+    def get_summary(self, conversation_id: str) -> Optional[ConversationSummary]: ...
+
+    @abstractmethod
+    def set_summary(self, conversation_id: str, summary: ConversationSummary): ...
+
+    def get_messages(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[ModelMessage]:
+        """Return the conversation as validated messages, ready to send to an agent."""
+        return [
+            record.message
+            for record in self.get_records(conversation_id, offset, limit)
+        ]
+
+    def get_conversation(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the conversation in its JSON form."""
+        return [
+            record.payload
+            for record in self.get_records(conversation_id, offset, limit)
+        ]
+
+    def add_message(self, conversation_id: str, message: ModelMessage):
+        self.add_messages(conversation_id, [message])
+
+
+def _paginate(
+    records: List[StoredMessage], offset: int, limit: Optional[int]
+) -> List[StoredMessage]:
+    if limit is None:
+        return records[offset:]
+    return records[offset : offset + limit]
+
+
+class LocalMemory(BaseMemory):
     def __init__(self):
-        self.storage: Dict[str, List[Dict[str, str]]] = {}
+        self.storage: Dict[str, List[StoredMessage]] = {}
+        self.summaries: Dict[str, ConversationSummary] = {}
 
-    def get_conversation(self, conversation_id: str) -> List[Dict[str, str]]:
-        return self.storage.get(conversation_id, [])
+    def get_records(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[StoredMessage]:
+        return _paginate(self.storage.get(conversation_id, []), offset, limit)
 
-    def add_message(self, conversation_id: str, message: Dict[str, str]):
+    def add_messages(self, conversation_id: str, messages: List[ModelMessage]):
         if conversation_id not in self.storage:
             self.storage[conversation_id] = []
-        self.storage[conversation_id].append(message)
+        self.storage[conversation_id].extend(
+            StoredMessage(message=message) for message in messages
+        )
+
+    def set_conversation(self, conversation_id: str, messages: List[ModelMessage]):
+        self.storage[conversation_id] = [
+            StoredMessage(message=message) for message in messages
+        ]
+        self.summaries.pop(conversation_id, None)
+
+    def get_summary(self, conversation_id: str) -> Optional[ConversationSummary]:
+        return self.summaries.get(conversation_id)
+
+    def set_summary(self, conversation_id: str, summary: ConversationSummary):
+        self.summaries[conversation_id] = summary
+
+
+class SQLiteMemory(BaseMemory):
+    """
+    Durable conversation store backed by SQLite in WAL mode.
+
+    Messages are appended with a per-conversation sequence number and read
+    back in order, optionally paginated. Conversations idle for longer than
+    `ttl_seconds`, or beyond the `max_conversations` most recently used, are
+    evicted. The most recently used conversations are also kept in an
+    in-process LRU so hot chats are served without touching the database.
+    """
+
+    EVICTION_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = None,
+        max_conversations: Optional[int] = None,
+        cache_size: int = 64,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_conversations = max_conversations
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, List[StoredMessage]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_eviction = 0.0
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversations (
+                    conversation_id TEXT PRIMARY KEY,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    message_count INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_conversations_updated_at "
+                "ON conversations (updated_at)"
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    conversation_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (conversation_id, seq)
+                ) WITHOUT ROWID
+                """
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS summaries (
+                    conversation_id TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    message_count INTEGER NOT NULL
+                )
+                """
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def get_records(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[StoredMessage]:
+        with self._lock:
+            cached = self._cache.get(conversation_id)
+            if cached is not None:
+                self._cache.move_to_end(conversation_id)
+                return _paginate(cached, offset, limit)
+
+            if offset or limit is not None:
+                rows = self._connection.execute(
+                    "SELECT payload FROM messages WHERE conversation_id = ? "
+                    "ORDER BY seq LIMIT ? OFFSET ?",
+                    (conversation_id, -1 if limit is None else limit, offset),
+                ).fetchall()
+                return [StoredMessage(payload=json.loads(row[0])) for row in rows]
+
+            rows = self._connection.execute(
+                "SELECT payload FROM messages WHERE conversation_id = ? ORDER BY seq",
+                (conversation_id,),
+            ).fetchall()
+            records = [StoredMessage(payload=json.loads(row[0])) for row in rows]
+            if records:
+                self._cache_conversation(conversation_id, records)
+            return list(records)
+
+    def add_messages(self, conversation_id: str, messages: List[ModelMessage]):
+        if not messages:
+            return
+        records = [StoredMessage(message=message) for message in messages]
+        now = time.time()
+        with self._lock:
+            with self._connection:
+                row = self._connection.execute(
+                    "SELECT message_count FROM conversations WHERE conversation_id = ?",
+                    (conversation_id,),
+                ).fetchone()
+                start = row[0] if row else 0
+                self._connection.executemany(
+                    "INSERT INTO messages (conversation_id, seq, payload) VALUES (?, ?, ?)",
+                    [
+                        (conversation_id, start + i, json.dumps(record.payload))
+                        for i, record in enumerate(records)
+                    ],
+                )
+                self._upsert_conversation(conversation_id, start + len(records), now)
+
+            cached = self._cache.get(conversation_id)
+            if cached is not None:
+                cached.extend(records)
+                self._cache.move_to_end(conversation_id)
+            self._maybe_evict(now)
+
+    def set_conversation(self, conversation_id: str, messages: List[ModelMessage]):
+        records = [StoredMessage(message=message) for message in messages]
+        now = time.time()
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM messages WHERE conversation_id = ?", (conversation_id,)
+                )
+                self._connection.execute(
+                    "DELETE FROM summaries WHERE conversation_id = ?",
+                    (conversation_id,),
+                )
+                self._connection.executemany(
+                    "INSERT INTO messages (conversation_id, seq, payload) VALUES (?, ?, ?)",
+                    [
+                        (conversation_id, i, json.dumps(record.payload))
+                        for i, record in enumerate(records)
+                    ],
+                )
+                self._upsert_conversation(conversation_id, len(records), now)
+            self._cache_conversation(conversation_id, records)
+            self._maybe_evict(now)
+
+    def get_summary(self, conversation_id: str) -> Optional[ConversationSummary]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, message_count FROM summaries WHERE conversation_id = ?",
+                (conversation_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return ConversationSummary(content=row[0], message_count=row[1])
+
+    def set_summary(self, conversation_id: str, summary: ConversationSummary):
+        with self._lock, self._connection:
+            self._connection.execute(
+                """
+                INSERT INTO summaries (conversation_id, content, message_count)
+                VALUES (?, ?, ?)
+                ON CONFLICT (conversation_id) DO UPDATE SET
+                    content = excluded.content,
+                    message_count = excluded.message_count
+                """,
+                (conversation_id, summary.content, summary.message_count),
+            )
+
+    def evict(self):
+        """Delete expired conversations and trim the store to `max_conversations`."""
+        with self._lock:
+            self._evict(time.time())
+
+    def _upsert_conversation(
+        self, conversation_id: str, message_count: int, now: float
+    ):
+        self._connection.execute(
+            """
+            INSERT INTO conversations (conversation_id, created_at, updated_at, message_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (conversation_id) DO UPDATE SET
+                updated_at = excluded.updated_at,
+                message_count = excluded.message_count
+            """,
+            (conversation_id, now, now, message_count),
+        )
+
+    def _cache_conversation(self, conversation_id: str, records: List[StoredMessage]):
+        self._cache[conversation_id] = records
+        self._cache.move_to_end(conversation_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _maybe_evict(self, now: float):
+        if now - self._last_eviction >= self.EVICTION_INTERVAL:
+            self._evict(now)
+
+    def _evict(self, now: float):
+        self._last_eviction = now
+        expired: List[str] = []
+        if self.ttl_seconds is not None:
+            expired += [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT conversation_id FROM conversations WHERE updated_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+            ]
+        if self.max_conversations is not None:
+            expired += [
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT conversation_id FROM conversations "
+                    "ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+                    (self.max_conversations,),
+                )
+            ]
+        if not expired:
+            return
+
+        with self._connection:
+            for conversation_id in set(expired):
+                self._connection.execute(
+                    "DELETE FROM messages WHERE conversation_id = ?", (conversation_id,)
+                )
+                self._connection.execute(
+                    "DELETE FROM summaries WHERE conversation_id = ?",
+                    (conversation_id,),
+                )
+                self._connection.execute(
+                    "DELETE FROM conversations WHERE conversation_id = ?",
+                    (conversation_id,),
+                )
+                self._cache.pop(conversation_id, None)
+
+
+class AsyncMemory:
+    """
+    Non-blocking facade over a BaseMemory for the API routes and agents.
+
+    SQLite queries and the store's lock run in a worker thread, so they never
+    stall the event loop serving streaming chat responses.
+    """
+
+    def __init__(self, memory: BaseMemory):
+        self.memory = memory
+
+    async def get_messages(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[ModelMessage]:
+        return await asyncio.to_thread(
+            self.memory.get_messages, conversation_id, offset, limit
+        )
+
+    async def get_conversation(
+        self, conversation_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self.memory.get_conversation, conversation_id, offset, limit
+        )
+
+    async def add_messages(self, conversation_id: str, messages: List[ModelMessage]):
+        await asyncio.to_thread(self.memory.add_messages, conversation_id, messages)
+
+    async def add_message(self, conversation_id: str, message: ModelMessage):
+        await asyncio.to_thread(self.memory.add_message, conversation_id, message)
+
+    async def set_conversation(
+        self, conversation_id: str, messages: List[ModelMessage]
+    ):
+        await asyncio.to_thread(self.memory.set_conversation, conversation_id, messages)
+
+    async def get_summary(self, conversation_id: str) -> Optional[ConversationSummary]:
+        return await asyncio.to_thread(self.memory.get_summary, conversation_id)
+
+    async def set_summary(self, conversation_id: str, summary: ConversationSummary):
+        await asyncio.to_thread(self.memory.set_summary, conversation_id, summary)
 
-    def add_messages(self, conversation_id: str, messages: List[Dict[str, str]]):
-        if conversation_id not in self.storage:
-            self.storage[conversation_id] = []
-        self.storage[conversation_id].extend(messages)
 
-    def set_conversation(self, conversation_id: str, messages: List[Dict[str, str]]):
-        self.storage[conversation_id] = messages
+def create_memory(config: Optional[MemoryConfig] = None) -> BaseMemory:
+    config = config or MemoryConfig()
+    if config.backend == "sqlite":
+        return SQLiteMemory(
+            path=config.sqlite_path,
+            ttl_seconds=config.ttl_seconds,
+            max_conversations=config.max_conversations,
+            cache_size=config.cache_size,
+        )
+    return LocalMemory()
@@ -0,0 +1,173 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from jinja2.runtime import Context
+from app.core.templates import CompiledTemplate, TemplateRegistry
+from app.models.resume import Resume
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import threading
+
+
+@dataclass
+class Fragment:
+    name: str
+    hash: str
+    html: str
+
+
+@dataclass
+class FragmentPreview:
+    template_hash: str
+    # only the fragments the client doesn't have yet
+    fragments: Dict[str, Fragment] = field(default_factory=dict)
+    unchanged: List[str] = field(default_factory=list)
+    # the whole document, when the client has nothing to patch
+    html: Optional[str] = None
+
+
+def fragment_fields(compiled: CompiledTemplate) -> Dict[str, Optional[List[str]]]:
+    """
+    Map each block of a template to the resume fields it depends on. Fields
+    are declared in the `fragments` section of the front matter; otherwise a
+    block named after a resume field depends on that field only, and any
+    other block on the whole resume (None).
+    """
+    declared = compiled.front_matter.get("fragments")
+    if not isinstance(declared, dict):
+        declared = {}
+
+    fields: Dict[str, Optional[List[str]]] = {}
+    for name in compiled.template.blocks:
+        depends_on = declared.get(name)
+        if isinstance(depends_on, list):
+            fields[name] = [str(field_name) for field_name in depends_on]
+        elif name in Resume.model_fields:
+            fields[name] = [name]
+        else:
+            fields[name] = None
+    return fields
+
+
+def _render_document(
+    compiled: CompiledTemplate, context: Context, rendered: Dict[str, str]
+) -> str:
+    """
+    Render the whole template, recording the output of each block in
+    `rendered` on the way, so fragments don't need a render of their own.
+    """
+    for name, stack in context.blocks.items():
+        render_block = stack[0]
+
+        def capture(block_context: Context, render_block=render_block, name=name):
+            html = "".join(render_block(block_context))
+            rendered.setdefault(name, html)
+            yield html
+
+        stack[0] = capture
+    return "".join(compiled.template.root_render_func(context))
+
+
+class FragmentRenderer:
+    """
+    Renders templates block by block for incremental previews.
+
+    Every `{% block %}` of a template is a fragment, wrapped in an element with
+    a `data-fragment` attribute so that clients can swap it in the DOM. A
+    fragment's hash covers the template, the template variables and only the
+    resume fields the fragment depends on, and rendered fragments are cached
+    by that hash: editing one experience item re-renders the experience
+    fragment alone.
+    """
+
+    def __init__(self, registry: TemplateRegistry, max_size: int = 1024):
+        self.registry = registry
+        self.max_size = max_size
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(
+        self,
+        template_name: str,
+        resume: Resume,
+        template_variables: Optional[Dict[str, Any]],
+        known: Optional[Dict[str, str]] = None,
+        template_hash: Optional[str] = None,
+    ) -> Optional[FragmentPreview]:
+        """
+        Render the fragments whose hash differs from `known` (fragment name ->
+        hash the client has). The whole document is included too if the
+        client's `template_hash` is outdated. Returns None for unknown templates.
+        """
+        compiled = self.registry.get(template_name)
+        if compiled is None:
+            return None
+        known = known or {}
+
+        preview = FragmentPreview(template_hash=compiled.sha256)
+        context = None
+        # fragment name -> html, captured while rendering the whole document
+        rendered: Dict[str, str] = {}
+        if template_hash != compiled.sha256:
+            known = {}
+            context = self._new_context(compiled, resume, template_variables)
+            preview.html = _render_document(compiled, context, rendered)
+
+        data = resume.model_dump(mode="json")
+        variables_json = json.dumps(
+            template_variables or {}, sort_keys=True, default=str
+        )
+        for name, fields in fragment_fields(compiled).items():
+            scope = data if fields is None else {key: data.get(key) for key in fields}
+            digest = hashlib.sha256()
+            for part in (
+                compiled.sha256,
+                name,
+                json.dumps(scope, sort_keys=True, default=str),
+                variables_json,
+            ):
+                digest.update(part.encode("utf-8"))
+                digest.update(b"\0")
+            fragment_hash = digest.hexdigest()
+
+            if known.get(name) == fragment_hash:
+                preview.unchanged.append(name)
+                continue
+
+            html = rendered.get(name)
+            if html is None:
+                html = self._get(fragment_hash)
+            if html is None:
+                if context is None:
+                    context = self._new_context(compiled, resume, template_variables)
+                html = "".join(compiled.template.blocks[name](context))
+            self._put(fragment_hash, html)
+            preview.fragments[name] = Fragment(name=name, hash=fragment_hash, html=html)
+        return preview
+
+    def _new_context(
+        self,
+        compiled: CompiledTemplate,
+        resume: Resume,
+        template_variables: Optional[Dict[str, Any]],
+    ) -> Context:
+        return compiled.template.new_context(
+            {
+                "resume": resume.visible_only(),
+                "variables": template_variables or {},
+            }
+        )
+
+    def _get(self, fragment_hash: str) -> Optional[str]:
+        with self._lock:
+            html = self._cache.get(fragment_hash)
+            if html is not None:
+                self._cache.move_to_end(fragment_hash)
+            return html
+
+    def _put(self, fragment_hash: str, html: str):
+        with self._lock:
+            self._cache[fragment_hash] = html
+            self._cache.move_to_end(fragment_hash)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
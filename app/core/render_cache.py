@@ -0,0 +1,115 @@
+from pydantic_settings import BaseSettings
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+
+# render keys are sha256 hex digests; anything else could escape the folder
+RENDER_KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+class RenderCacheConfig(BaseSettings):
+    enabled: bool = True
+    folder: str = "documents/cache/renders"
+    max_bytes: int = 256 * 1024 * 1024
+
+    class Config:
+        env_prefix = "RENDER_CACHE_"
+        env_file = ".env"
+
+
+def render_cache_key(
+    resume_json: str,
+    template_hash: str,
+    template_variables: Optional[Dict[str, Any]],
+    pdf_options: Dict[str, Any],
+    dependencies: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    Hash every input of a render; identical inputs always produce identical
+    outputs. `dependencies` maps other files the output embeds (e.g. icons)
+    to a hash of their content.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        resume_json,
+        template_hash,
+        json.dumps(template_variables or {}, sort_keys=True, default=str),
+        json.dumps(pdf_options, sort_keys=True),
+        json.dumps(dependencies or {}, sort_keys=True),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered HTML and PDF files on local disk.
+
+    Entries are named after their render key and evicted least recently used
+    first (by file mtime, refreshed on every hit) once the folder grows past
+    `max_bytes`.
+    """
+
+    def __init__(self, folder: str, max_bytes: int):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+        self._total_bytes = sum(
+            entry.stat().st_size for entry in os.scandir(folder) if entry.is_file()
+        )
+
+    def _path(self, key: str, kind: str) -> str:
+        if not RENDER_KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"Invalid render key: {key!r}")
+        return os.path.join(self.folder, f"{key}.{kind}")
+
+    def get(self, key: str, kind: str) -> Optional[bytes]:
+        if not RENDER_KEY_PATTERN.fullmatch(key):
+            return None
+        path = self._path(key, kind)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, kind: str, data: bytes):
+        path = self._path(key, kind)
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            try:
+                self._total_bytes -= os.stat(path).st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = sorted(
+            (entry for entry in os.scandir(self.folder) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        self._total_bytes = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            size = entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            self._total_bytes -= size
@@ -0,0 +1,193 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings
+from app.core.rendering import PDF_OPTIONS, PdfConfig, render_template
+from app.core.templates import TemplateRegistry
+from app.models.resume import Resume
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RenderWorkerConfig(BaseSettings):
+    # 0 renders in the API process
+    processes: int = 0
+
+    class Config:
+        env_prefix = "RENDER_WORKERS_"
+        env_file = ".env"
+
+
+# State of a worker process, set up once by _init_worker
+_registry: Optional[TemplateRegistry] = None
+_playwright: Any = None
+_browser: Any = None
+
+
+def _init_worker(template_folder: str):
+    global _registry
+    _registry = TemplateRegistry(template_folder=template_folder)
+    try:
+        _get_browser()
+    except Exception:
+        # PDFs retry the launch; HTML rendering doesn't need a browser
+        logger.exception("Failed to start the worker browser")
+
+
+def _get_browser():
+    global _playwright, _browser
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    from playwright.sync_api import sync_playwright
+
+    if _playwright is None:
+        _playwright = sync_playwright().start()
+    _browser = _playwright.chromium.launch()
+    return _browser
+
+
+def _render_html(
+    template_name: str, resume: Resume, template_variables: Optional[Dict[str, Any]]
+) -> Tuple[int, float, str]:
+    started = time.perf_counter()
+    assert _registry is not None
+    html = render_template(_registry.get(template_name), resume, template_variables)
+    return os.getpid(), time.perf_counter() - started, html
+
+
+def _render_pdf(html: str, pdf_config: PdfConfig) -> Tuple[int, float, bytes]:
+    started = time.perf_counter()
+    page = _get_browser().new_page()
+    try:
+        if pdf_config.block_requests:
+            page.route("**/*", lambda route: route.abort())
+        page.set_content(html, wait_until=pdf_config.wait_until)
+        pdf = page.pdf(**PDF_OPTIONS)
+    finally:
+        page.close()
+    return os.getpid(), time.perf_counter() - started, pdf
+
+
+@dataclass
+class _WorkerStats:
+    tasks: int = 0
+    busy_seconds: float = 0.0
+
+
+class RenderWorkerUtilization(BaseModel):
+    pid: int
+    tasks: int
+    busy_seconds: float
+    utilization: float
+
+
+class RenderWorkerPool:
+    """
+    Pool of worker processes rendering templates and PDFs.
+
+    Each process keeps its own template registry and Chromium instance warm,
+    so CPU-heavy Jinja rendering and PDF printing spread over several cores
+    instead of sharing the API process' event loop. Worker time is tracked per
+    process to report utilization.
+    """
+
+    def __init__(self, template_folder: str, processes: int):
+        self.template_folder = template_folder
+        self.processes = processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._stats: Dict[int, _WorkerStats] = {}
+        self._started_at = time.monotonic()
+        self._in_flight = 0
+
+    async def start(self):
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            # fork is unsafe with the API's threads and event loop
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.template_folder,),
+        )
+        self._started_at = time.monotonic()
+        logger.info("Render worker pool started with %d processes", self.processes)
+
+    async def stop(self):
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    async def render_html(
+        self,
+        template_name: str,
+        resume: Resume,
+        template_variables: Optional[Dict[str, Any]],
+    ) -> str:
+        return await self._run(_render_html, template_name, resume, template_variables)
+
+    async def render_pdf(self, html: str, pdf_config: PdfConfig) -> bytes:
+        return await self._run(_render_pdf, html, pdf_config)
+
+    def utilization(self) -> List[RenderWorkerUtilization]:
+        uptime = max(time.monotonic() - self._started_at, 1e-9)
+        return [
+            RenderWorkerUtilization(
+                pid=pid,
+                tasks=stats.tasks,
+                busy_seconds=stats.busy_seconds,
+                utilization=min(stats.busy_seconds / uptime, 1.0),
+            )
+            for pid, stats in sorted(self._stats.items())
+        ]
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def _run(self, fn: Callable[..., Tuple[int, float, T]], *args: Any) -> T:
+        # a crashed worker (e.g. Chromium running out of memory) breaks the
+        # whole executor: start a new one and retry once
+        error: Optional[BrokenProcessPool] = None
+        for _ in range(2):
+            if self._executor is None:
+                await self.start()
+            executor = self._executor
+            assert executor is not None
+
+            self._in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                pid, busy_seconds, result = await loop.run_in_executor(
+                    executor, fn, *args
+                )
+            except BrokenProcessPool as e:
+                logger.warning("Render worker pool broke, restarting it")
+                await self._restart(executor)
+                error = e
+                continue
+            finally:
+                self._in_flight -= 1
+            stats = self._stats.setdefault(pid, _WorkerStats())
+            stats.tasks += 1
+            stats.busy_seconds += busy_seconds
+            return result
+        assert error is not None
+        raise error
+
+    async def _restart(self, broken: ProcessPoolExecutor):
+        # concurrent requests share the broken executor; replace it once
+        if self._executor is broken:
+            self._executor = None
+            broken.shutdown(wait=False, cancel_futures=True)
+            await self.start()
@@ -0,0 +1,315 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from playwright.async_api import Route
+from pydantic_settings import BaseSettings
+from app.core.browser_pool import BrowserPool
+from app.core.render_cache import RenderCache, render_cache_key
+from app.core.storage import AsyncDocumentStorage
+from app.core.templates import CompiledTemplate, TemplateRegistry
+from app.models.resume import Resume
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Tuple, Union
+import asyncio
+import hashlib
+import threading
+import time
+
+if TYPE_CHECKING:
+    from app.core.render_workers import RenderWorkerPool
+
+
+PDF_OPTIONS: Dict[str, Any] = {"format": "A4", "print_background": True}  # keep colors
+
+
+class PdfConfig(BaseSettings):
+    # templates are self-contained once their assets are inlined, so there is
+    # no network activity to wait for
+    wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "load"
+    block_requests: bool = True
+
+    class Config:
+        env_prefix = "PDF_"
+        env_file = ".env"
+
+
+async def _abort_request(route: Route):
+    await route.abort()
+
+
+def render_template(
+    compiled: Optional[CompiledTemplate],
+    resume: Resume,
+    template_variables: Optional[Dict[str, Any]],
+) -> str:
+    if compiled is None:
+        return ""
+
+    # templates only ever see the visible items
+    render_context: Dict[str, Any] = {"resume": resume.visible_only()}
+    render_context["variables"] = template_variables or {}
+    return compiled.template.render(**render_context)
+
+
+@dataclass
+class RenderArtifact:
+    """
+    The output of one render: the HTML and, if requested, the PDF made from it.
+    `id` is the render key, a hash of every render input.
+    """
+
+    id: str
+    html: str
+    content_hash: str
+    pdf: Optional[bytes] = None
+    template_name: Optional[str] = None
+    resume_name: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.id}"'
+
+
+@dataclass
+class PreparedRender:
+    """The inputs of a render, loaded and hashed into the render key but not rendered."""
+
+    key: str
+    compiled: CompiledTemplate
+    template_name: str
+    resume_name: str
+    resume: Resume
+    template_variables: Optional[Dict[str, Any]]
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.key}"'
+
+
+@dataclass
+class RenderNotFound:
+    """Returned instead of an artifact when the resume or the template doesn't exist."""
+
+    message: str
+
+
+RenderResult = Union[RenderArtifact, RenderNotFound]
+
+
+class RenderArtifactStore:
+    """Bounded in-memory store of recent render artifacts, for later downloads."""
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._artifacts: OrderedDict[str, RenderArtifact] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, artifact_id: str) -> Optional[RenderArtifact]:
+        with self._lock:
+            artifact = self._artifacts.get(artifact_id)
+            if artifact is not None:
+                self._artifacts.move_to_end(artifact_id)
+            return artifact
+
+    def put(self, artifact: RenderArtifact):
+        with self._lock:
+            self._artifacts[artifact.id] = artifact
+            self._artifacts.move_to_end(artifact.id)
+            while len(self._artifacts) > self.max_size:
+                self._artifacts.popitem(last=False)
+
+
+class RenderPipeline:
+    """
+    Shared resume rendering pipeline: load the resume, render the template to
+    HTML and print the HTML to PDF. Used by every render endpoint so each step
+    runs once per request. With a worker pool, rendering and printing run in
+    the worker processes instead of this one.
+    """
+
+    def __init__(
+        self,
+        storage: AsyncDocumentStorage,
+        registry: TemplateRegistry,
+        browser_pool: BrowserPool,
+        artifacts: Optional[RenderArtifactStore] = None,
+        cache: Optional[RenderCache] = None,
+        workers: Optional["RenderWorkerPool"] = None,
+        pdf_config: Optional[PdfConfig] = None,
+    ):
+        self.storage = storage
+        self.registry = registry
+        self.browser_pool = browser_pool
+        self.artifacts = artifacts or RenderArtifactStore()
+        self.cache = cache
+        self.workers = workers
+        self.pdf_config = pdf_config or PdfConfig()
+        self._key_options = {**PDF_OPTIONS, **self.pdf_config.model_dump()}
+
+    async def start(self):
+        """Start the worker pool if there is one, or else the browser pool."""
+        if self.workers:
+            await self.workers.start()
+        else:
+            await self.browser_pool.start()
+
+    async def stop(self):
+        if self.workers:
+            await self.workers.stop()
+        await self.browser_pool.stop()
+
+    async def load_resume(self, resume_name: str) -> Optional[Resume]:
+        try:
+            return await self.storage.get_resume(resume_name=resume_name)
+        except FileNotFoundError:
+            return None
+
+    async def render_pdf(self, html: str) -> bytes:
+        if self.workers:
+            return await self.workers.render_pdf(html, self.pdf_config)
+        async with self.browser_pool.page() as page:
+            if self.pdf_config.block_requests:
+                await page.route("**/*", _abort_request)
+            await page.set_content(html, wait_until=self.pdf_config.wait_until)
+            return await page.pdf(**PDF_OPTIONS)
+
+    async def prepare(
+        self,
+        template_name: str,
+        resume_name: str,
+        template_variables: Optional[Dict[str, Any]],
+    ) -> Union[PreparedRender, RenderNotFound]:
+        """
+        Load the resume and template and compute the render key, without
+        rendering; returns a RenderNotFound if either of them doesn't exist.
+        """
+        resume = await self.load_resume(resume_name)
+        if resume is None:
+            return RenderNotFound("Resume not found")
+        key, compiled = await asyncio.to_thread(
+            self._render_key, template_name, resume, template_variables
+        )
+        if compiled is None:
+            return RenderNotFound("Template not found")
+        return PreparedRender(
+            key=key,
+            compiled=compiled,
+            template_name=template_name,
+            resume_name=resume_name,
+            resume=resume,
+            template_variables=template_variables,
+        )
+
+    async def render(
+        self,
+        template_name: str,
+        resume_name: str,
+        template_variables: Optional[Dict[str, Any]],
+        pdf: bool = True,
+    ) -> RenderResult:
+        """
+        Render a resume with a template; returns a RenderNotFound if either of
+        them doesn't exist.
+        """
+        prepared = await self.prepare(template_name, resume_name, template_variables)
+        if isinstance(prepared, RenderNotFound):
+            return prepared
+        return await self.render_prepared(prepared, pdf=pdf)
+
+    async def render_prepared(
+        self, prepared: PreparedRender, pdf: bool = True
+    ) -> RenderArtifact:
+        """
+        Render prepared inputs. Outputs are looked up in the render cache first,
+        by the render key: a hash of the resume, template source, variables and
+        PDF settings.
+        """
+        artifact = await self._html_artifact(prepared)
+        if pdf and artifact.pdf is None:
+            pdf_bytes = None
+            if self.cache:
+                pdf_bytes = await asyncio.to_thread(self.cache.get, artifact.id, "pdf")
+            if pdf_bytes is None:
+                pdf_bytes = await self.render_pdf(artifact.html)
+                if self.cache:
+                    await asyncio.to_thread(
+                        self.cache.put, artifact.id, "pdf", pdf_bytes
+                    )
+            artifact.pdf = pdf_bytes
+        self.artifacts.put(artifact)
+        return artifact
+
+    def get_artifact(self, artifact_id: str) -> Optional[RenderArtifact]:
+        """Find a previous render by id, in memory first and then in the render cache."""
+        artifact = self.artifacts.get(artifact_id)
+        if artifact is not None or self.cache is None:
+            return artifact
+
+        html = self.cache.get(artifact_id, "html")
+        if html is None:
+            return None
+        artifact = RenderArtifact(
+            id=artifact_id,
+            html=html.decode("utf-8"),
+            content_hash=hashlib.sha256(html).hexdigest(),
+            pdf=self.cache.get(artifact_id, "pdf"),
+        )
+        self.artifacts.put(artifact)
+        return artifact
+
+    def _render_key(
+        self,
+        template_name: str,
+        resume: Resume,
+        template_variables: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Optional[CompiledTemplate]]:
+        compiled = self.registry.get(template_name)
+        # link icons are embedded from files too, see Link.link_icon
+        icons = {
+            link.link_icon_path: hashlib.sha256(
+                (link.link_icon or "").encode("utf-8")
+            ).hexdigest()
+            for link in resume.links
+            if link.link_icon_path
+        }
+        key = render_cache_key(
+            resume.model_dump_json(),
+            compiled.sha256 if compiled else "",
+            template_variables,
+            self._key_options,
+            icons,
+        )
+        return key, compiled
+
+    async def _html_artifact(self, prepared: PreparedRender) -> RenderArtifact:
+        key = prepared.key
+        artifact = self.artifacts.get(key)
+        if artifact is not None:
+            return artifact
+
+        html_bytes = None
+        if self.cache:
+            html_bytes = await asyncio.to_thread(self.cache.get, key, "html")
+        if html_bytes is None:
+            if self.workers:
+                html = await self.workers.render_html(
+                    prepared.template_name,
+                    prepared.resume,
+                    prepared.template_variables,
+                )
+            else:
+                html = await asyncio.to_thread(
+                    render_template,
+                    prepared.compiled,
+                    prepared.resume,
+                    prepared.template_variables,
+                )
+            html_bytes = html.encode("utf-8")
+            if self.cache:
+                await asyncio.to_thread(self.cache.put, key, "html", html_bytes)
+        return RenderArtifact(
+            id=key,
+            html=html_bytes.decode("utf-8"),
+            content_hash=hashlib.sha256(html_bytes).hexdigest(),
+            template_name=prepared.template_name,
+            resume_name=prepared.resume_name,
+        )
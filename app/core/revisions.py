@@ -0,0 +1,178 @@
+from pydantic import BaseModel, Field
+from app.models.resume import RESUME_COLLECTIONS, Resume
+from typing import Any, Dict, List, Optional
+import hashlib
+import os
+import re
+import tempfile
+
+REVISION_FILE_PATTERN = re.compile(r"^(\d+)-([0-9a-f]{64})\.yaml$")
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ResumeRevision(BaseModel):
+    version: int
+    content_hash: str
+    created_at: float
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}-{self.content_hash[:16]}"'
+
+
+class RevisionStore:
+    """
+    Append-only history of a resume's saved contents on local disk.
+
+    Every revision is a file named `<version>-<sha256>.yaml` in a folder per
+    resume, so listing revisions never reads file contents. Versions increase
+    monotonically; only the newest `max_revisions` are kept.
+    """
+
+    def __init__(self, folder: str, max_revisions: int = 50):
+        self.folder = folder
+        self.max_revisions = max_revisions
+
+    def _resume_folder(self, resume_name: str) -> str:
+        return os.path.join(self.folder, resume_name)
+
+    def list_revisions(self, resume_name: str) -> List[ResumeRevision]:
+        folder = self._resume_folder(resume_name)
+        try:
+            entries = list(os.scandir(folder))
+        except FileNotFoundError:
+            return []
+
+        revisions: List[ResumeRevision] = []
+        for entry in entries:
+            match = REVISION_FILE_PATTERN.match(entry.name)
+            if match:
+                revisions.append(
+                    ResumeRevision(
+                        version=int(match.group(1)),
+                        content_hash=match.group(2),
+                        created_at=entry.stat().st_mtime,
+                    )
+                )
+        return sorted(revisions, key=lambda revision: revision.version)
+
+    def head(self, resume_name: str) -> Optional[ResumeRevision]:
+        revisions = self.list_revisions(resume_name)
+        return revisions[-1] if revisions else None
+
+    def get(self, resume_name: str, version: int) -> Optional[ResumeRevision]:
+        for revision in self.list_revisions(resume_name):
+            if revision.version == version:
+                return revision
+        return None
+
+    def read(self, resume_name: str, revision: ResumeRevision) -> str:
+        path = os.path.join(
+            self._resume_folder(resume_name),
+            f"{revision.version:08d}-{revision.content_hash}.yaml",
+        )
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def add(self, resume_name: str, content: str) -> ResumeRevision:
+        """Store `content` as the next revision; callers serialize adds per resume."""
+        head = self.head(resume_name)
+        version = head.version + 1 if head else 1
+        digest = content_hash(content)
+
+        folder = self._resume_folder(resume_name)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{version:08d}-{digest}.yaml")
+        write_atomic(path, content)
+        self.compact(resume_name)
+        return ResumeRevision(
+            version=version, content_hash=digest, created_at=os.stat(path).st_mtime
+        )
+
+    def compact(self, resume_name: str):
+        """Delete all but the newest `max_revisions` revisions."""
+        revisions = self.list_revisions(resume_name)
+        for revision in revisions[: -self.max_revisions]:
+            try:
+                os.remove(
+                    os.path.join(
+                        self._resume_folder(resume_name),
+                        f"{revision.version:08d}-{revision.content_hash}.yaml",
+                    )
+                )
+            except FileNotFoundError:
+                pass
+
+
+def write_atomic(path: str, content: str):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class CollectionDiff(BaseModel):
+    added: List[Dict[str, Any]] = Field(default_factory=list)
+    changed: List[Dict[str, Any]] = Field(default_factory=list)
+    removed: List[str] = Field(default_factory=list)
+    # item ids in their new order, set only if the order changed
+    order: Optional[List[str]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed or self.order)
+
+
+class ResumeDiff(BaseModel):
+    from_version: Optional[int] = None
+    to_version: Optional[int] = None
+    fields: Dict[str, Any] = Field(default_factory=dict)
+    collections: Dict[str, CollectionDiff] = Field(default_factory=dict)
+
+
+def diff_resumes(old: Resume, new: Resume) -> ResumeDiff:
+    """
+    Structural diff of two resumes: changed scalar fields by name, and
+    added, changed, removed and reordered items of each collection by
+    `CvItem.id`.
+    """
+    old_data = old.model_dump(mode="json")
+    new_data = new.model_dump(mode="json")
+    diff = ResumeDiff()
+
+    for name, value in new_data.items():
+        if name not in RESUME_COLLECTIONS and old_data.get(name) != value:
+            diff.fields[name] = value
+
+    for name in RESUME_COLLECTIONS:
+        old_items = {item["id"]: item for item in old_data[name]}
+        new_items = {item["id"]: item for item in new_data[name]}
+        collection = CollectionDiff(
+            added=[item for id_, item in new_items.items() if id_ not in old_items],
+            changed=[
+                item
+                for id_, item in new_items.items()
+                if id_ in old_items and old_items[id_] != item
+            ],
+            removed=[id_ for id_ in old_items if id_ not in new_items],
+        )
+        # the order is reported only if it isn't the old order with the
+        # added items appended
+        default_order = [id_ for id_ in old_items if id_ in new_items] + [
+            item["id"] for item in collection.added
+        ]
+        if default_order != list(new_items):
+            collection.order = list(new_items)
+        if not collection.is_empty:
+            diff.collections[name] = collection
+    return diff
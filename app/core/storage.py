@@ -1,18 +1,72 @@
+from app.core.revisions import (
+    ResumeDiff,
+    ResumeRevision,
+    RevisionStore,
+    content_hash,
+    diff_resumes,
+    write_atomic,
+)
 from app.models.resume import Resume
+from collections import OrderedDict
+from dataclasses import dataclass
+from pydantic import ValidationError
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+import asyncio
 import os
+import threading
+import yaml
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class ResumeVersionConflict(Exception):
+    """A conditional save didn't match the resume's current revision."""
+
+    def __init__(self, resume_name: str, current: Optional[ResumeRevision]):
+        super().__init__(f"Resume {resume_name} was modified")
+        self.resume_name = resume_name
+        self.current = current
+
+
+def _is_change(result: object) -> bool:
+    """Whether an update_resume result means the resume was changed."""
+    return result is not None and result is not False
 
 
 class LocalDocumentStorage:
-    def __init__(self, base_folder: str = "documents"):
+    def __init__(
+        self,
+        base_folder: str = "documents",
+        max_cached_resumes: int = 32,
+        max_revisions: int = 50,
+    ):
         self.base_folder = base_folder
         self.resume_folder = os.path.join(base_folder, "resumes")
         self.template_folder = os.path.join(base_folder, "templates")
+        self.revision_folder = os.path.join(base_folder, "revisions")
+        self.max_cached_resumes = max_cached_resumes
+        self.revisions = RevisionStore(self.revision_folder, max_revisions)
+        self.cache_stats = CacheStats()
+        # resume name -> (mtime_ns, size, parsed resume)
+        self._resume_cache: OrderedDict[str, Tuple[int, int, Resume]] = OrderedDict()
+        # resume name -> (mtime_ns, size, current revision)
+        self._revision_cache: Dict[str, Tuple[int, int, ResumeRevision]] = {}
+        self._cache_lock = threading.Lock()
+        self._resume_locks: Dict[str, threading.RLock] = {}
         self.create_folders()
 
     def create_folders(self):
         os.makedirs(self.base_folder, exist_ok=True)
         os.makedirs(self.resume_folder, exist_ok=True)
         os.makedirs(self.template_folder, exist_ok=True)
+        os.makedirs(self.revision_folder, exist_ok=True)
 
     def list_resumes(self):
         return os.listdir(self.resume_folder)
@@ -20,12 +74,251 @@ class LocalDocumentStorage:
     def list_templates(self):
         return os.listdir(self.template_folder)
 
-    def save_resume(self, resume_content: str, resume_name: str):
+    def save_resume(
+        self, resume_content: str, resume_name: str, if_match: Optional[str] = None
+    ) -> ResumeRevision:
+        """
+        Save a resume as a new revision. With `if_match`, the save only happens
+        if it is the ETag of the current revision (or `*` and the resume
+        exists); otherwise ResumeVersionConflict is raised.
+        """
         resume_path = os.path.join(self.resume_folder, resume_name)
-        with open(resume_path, "w") as f:
-            f.write(resume_content)
+        with self._resume_lock(resume_name):
+            if if_match is not None:
+                current = self.get_revision(resume_name)
+                if current is None or (if_match != "*" and if_match != current.etag):
+                    raise ResumeVersionConflict(resume_name, current)
+
+            # keep edits made outside the API in the history
+            self._record_current(resume_name)
+            head = self.revisions.head(resume_name)
+            if head and head.content_hash == content_hash(resume_content):
+                revision = head  # unchanged, don't add a revision
+            else:
+                revision = self.revisions.add(resume_name, resume_content)
+            write_atomic(resume_path, resume_content)
+            stat = os.stat(resume_path)
+            with self._cache_lock:
+                self._revision_cache[resume_name] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    revision,
+                )
+
+        try:
+            resume = Resume.load_from_yaml_string(resume_content)
+        except (yaml.YAMLError, ValidationError):
+            self.invalidate_resume(resume_name)
+            return revision
+        self._cache_resume(resume_name, stat, resume)
+        return revision
+
+    def update_resume(
+        self,
+        resume_name: str,
+        update: Callable[[Resume], T],
+        if_match: Optional[str] = None,
+    ) -> Tuple[T, Optional[ResumeRevision]]:
+        """
+        Apply `update` to a copy of a resume and save the result, atomically
+        with respect to other saves of the same resume. Nothing is saved if
+        `update` returns None or False (e.g. the element wasn't found) or
+        raises. Returns the update's result and the resulting revision.
+        """
+        with self._resume_lock(resume_name):
+            current = self.get_revision(resume_name)
+            if current is None:
+                raise FileNotFoundError(resume_name)
+            if if_match is not None and if_match not in ("*", current.etag):
+                raise ResumeVersionConflict(resume_name, current)
+
+            resume = self.get_resume(resume_name).model_copy(deep=True)
+            result = update(resume)
+            if not _is_change(result):
+                return result, current
+            revision = self.save_resume(resume.dump_to_yaml_string(), resume_name)
+        return result, revision
+
+    def get_revision(self, resume_name: str) -> Optional[ResumeRevision]:
+        """
+        Current revision of a resume, or None if it doesn't exist. A resume
+        without history, or changed outside of save_resume, gets the next
+        version with an ETag computed from its content; nothing is written
+        until the next save records it.
+        """
+        resume_path = os.path.join(self.resume_folder, resume_name)
+        with self._resume_lock(resume_name):
+            try:
+                stat = os.stat(resume_path)
+            except FileNotFoundError:
+                return None
+            with self._cache_lock:
+                cached = self._revision_cache.get(resume_name)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+            with open(resume_path, "r", encoding="utf-8") as f:
+                digest = content_hash(f.read())
+            revision = self.revisions.head(resume_name)
+            if revision is None or revision.content_hash != digest:
+                revision = ResumeRevision(
+                    version=revision.version + 1 if revision else 1,
+                    content_hash=digest,
+                    created_at=stat.st_mtime,
+                )
+            with self._cache_lock:
+                self._revision_cache[resume_name] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    revision,
+                )
+            return revision
+
+    def _record_current(self, resume_name: str):
+        """Add the resume file to the history if it isn't the latest revision."""
+        resume_path = os.path.join(self.resume_folder, resume_name)
+        try:
+            with open(resume_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return
+        head = self.revisions.head(resume_name)
+        if head is None or head.content_hash != content_hash(content):
+            self.revisions.add(resume_name, content)
+
+    def list_revisions(self, resume_name: str) -> List[ResumeRevision]:
+        revisions = self.revisions.list_revisions(resume_name)
+        current = self.get_revision(resume_name)
+        if current and (not revisions or revisions[-1].version < current.version):
+            revisions.append(current)  # not recorded yet
+        return revisions
+
+    def get_resume_revision(self, resume_name: str, version: int) -> Optional[Resume]:
+        revision = self.revisions.get(resume_name, version)
+        if revision is None:
+            current = self.get_revision(resume_name)
+            if current is None or current.version != version:
+                return None
+            return self.get_resume(resume_name)  # not recorded yet
+        return Resume.load_from_yaml_string(self.revisions.read(resume_name, revision))
+
+    def diff_revisions(
+        self, resume_name: str, from_version: int, to_version: Optional[int] = None
+    ) -> Optional[ResumeDiff]:
+        """Diff two revisions, to the current one by default; None if one is missing."""
+        if to_version is None:
+            current = self.get_revision(resume_name)
+            if current is None:
+                return None
+            to_version = current.version
+        old = self.get_resume_revision(resume_name, from_version)
+        new = self.get_resume_revision(resume_name, to_version)
+        if old is None or new is None:
+            return None
+        diff = diff_resumes(old, new)
+        diff.from_version = from_version
+        diff.to_version = to_version
+        return diff
 
     def get_resume(self, resume_name: str) -> Resume:
+        """
+        Load a resume, serving it from the in-process cache while the file's
+        mtime and size are unchanged. The returned object is shared between
+        callers: copy it before editing.
+        """
         resume_path = os.path.join(self.resume_folder, resume_name)
+        stat = os.stat(resume_path)
+
+        with self._cache_lock:
+            cached = self._resume_cache.get(resume_name)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._resume_cache.move_to_end(resume_name)
+                self.cache_stats.hits += 1
+                return cached[2]
+            self.cache_stats.misses += 1
+
         with open(resume_path, "r") as f:
-            return Resume.load_from_yaml_string(f.read())
+            resume = Resume.load_from_yaml_string(f.read())
+        self._cache_resume(resume_name, stat, resume)
+        return resume
+
+    def _resume_lock(self, resume_name: str) -> threading.RLock:
+        with self._cache_lock:
+            return self._resume_locks.setdefault(resume_name, threading.RLock())
+
+    def invalidate_resume(self, resume_name: str):
+        with self._cache_lock:
+            self._resume_cache.pop(resume_name, None)
+
+    def _cache_resume(self, resume_name: str, stat: os.stat_result, resume: Resume):
+        with self._cache_lock:
+            self._resume_cache[resume_name] = (stat.st_mtime_ns, stat.st_size, resume)
+            self._resume_cache.move_to_end(resume_name)
+            while len(self._resume_cache) > self.max_cached_resumes:
+                self._resume_cache.popitem(last=False)
+
+
+class AsyncDocumentStorage:
+    """
+    Non-blocking facade over LocalDocumentStorage for the API routes.
+
+    Every disk operation is offloaded to a worker thread so slow I/O never
+    stalls the event loop that also serves streaming chat responses.
+    """
+
+    def __init__(self, storage: LocalDocumentStorage):
+        self.storage = storage
+
+    @property
+    def resume_folder(self) -> str:
+        return self.storage.resume_folder
+
+    @property
+    def template_folder(self) -> str:
+        return self.storage.template_folder
+
+    async def list_resumes(self) -> List[str]:
+        return await asyncio.to_thread(self.storage.list_resumes)
+
+    async def list_templates(self) -> List[str]:
+        return await asyncio.to_thread(self.storage.list_templates)
+
+    async def save_resume(
+        self, resume_content: str, resume_name: str, if_match: Optional[str] = None
+    ) -> ResumeRevision:
+        return await asyncio.to_thread(
+            self.storage.save_resume, resume_content, resume_name, if_match
+        )
+
+    async def get_resume(self, resume_name: str) -> Resume:
+        return await asyncio.to_thread(self.storage.get_resume, resume_name)
+
+    async def update_resume(
+        self,
+        resume_name: str,
+        update: Callable[[Resume], T],
+        if_match: Optional[str] = None,
+    ) -> Tuple[T, Optional[ResumeRevision]]:
+        return await asyncio.to_thread(
+            self.storage.update_resume, resume_name, update, if_match
+        )
+
+    async def get_revision(self, resume_name: str) -> Optional[ResumeRevision]:
+        return await asyncio.to_thread(self.storage.get_revision, resume_name)
+
+    async def list_revisions(self, resume_name: str) -> List[ResumeRevision]:
+        return await asyncio.to_thread(self.storage.list_revisions, resume_name)
+
+    async def get_resume_revision(
+        self, resume_name: str, version: int
+    ) -> Optional[Resume]:
+        return await asyncio.to_thread(
+            self.storage.get_resume_revision, resume_name, version
+        )
+
+    async def diff_revisions(
+        self, resume_name: str, from_version: int, to_version: Optional[int] = None
+    ) -> Optional[ResumeDiff]:
+        return await asyncio.to_thread(
+            self.storage.diff_revisions, resume_name, from_version, to_version
+        )
@@ -0,0 +1,322 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    Template,
+    TemplateSyntaxError,
+    meta,
+    select_autoescape,
+)
+from pydantic import ValidationError
+from app.core.assets import AssetInliner
+from app.models.template import TemplateVariable
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import threading
+import yaml
+
+logger = logging.getLogger(__name__)
+
+FRONT_MATTER_PATTERN = re.compile(r"^\s*---\s*\n(.*?)\n---\s*\n", re.S)
+
+
+def split_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a template file into its YAML front matter and the Jinja source.
+    Invalid or missing front matter yields an empty dict.
+    """
+    match = FRONT_MATTER_PATTERN.match(text)
+    if not match:
+        return {}, text
+    try:
+        front_matter = yaml.safe_load(match.group(1)) or {}
+    except yaml.YAMLError:
+        front_matter = {}
+    if not isinstance(front_matter, dict):
+        front_matter = {}
+    return front_matter, text[match.end() :]
+
+
+def parse_template_variables(
+    front_matter: Dict[str, Any],
+) -> Dict[str, TemplateVariable]:
+    """Validate the `variables` section of a template's front matter, skipping invalid entries."""
+    raw_vars = front_matter.get("variables", {})
+    if not isinstance(raw_vars, dict):
+        return {}
+
+    normalized: Dict[str, TemplateVariable] = {}
+    for name, definition in raw_vars.items():
+        if not isinstance(definition, dict):
+            continue
+        try:
+            normalized[name] = TemplateVariable.model_validate(definition)
+        except ValidationError:
+            continue
+    return normalized
+
+
+@dataclass
+class CompiledTemplate:
+    name: str
+    template: Template
+    front_matter: Dict[str, Any]
+    mtime_ns: int
+    size: int
+    sha256: str
+    # inlined asset and included/extended template path -> mtime_ns
+    assets: Dict[str, int] = field(default_factory=dict)
+
+    def assets_changed(self) -> bool:
+        for path, mtime_ns in self.assets.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+
+class TemplateRegistry:
+    """
+    Process-wide cache of compiled Jinja templates.
+
+    Each template file is read, stripped of its front matter, has its static
+    assets (stylesheets, fonts, images) inlined from the template folder or
+    `asset_folder`, and is compiled once; the result is kept in a bounded LRU
+    and recompiled only when the file's mtime or size, or an inlined asset,
+    changes.
+    """
+
+    def __init__(
+        self,
+        template_folder: str,
+        max_size: int = 32,
+        asset_folder: Optional[str] = None,
+    ):
+        self.template_folder = template_folder
+        self.max_size = max_size
+        self.inliner = AssetInliner(
+            [
+                template_folder,
+                asset_folder or os.path.dirname(os.path.abspath(template_folder)),
+            ]
+        )
+        self.env = Environment(
+            loader=FileSystemLoader(template_folder),
+            autoescape=select_autoescape(["html", "xml"]),
+        )
+        self._cache: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, template_name: str) -> Optional[CompiledTemplate]:
+        path = os.path.join(self.template_folder, template_name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self.invalidate(template_name)
+            return None
+
+        with self._lock:
+            cached = self._cache.get(template_name)
+            if (
+                cached
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+                and not cached.assets_changed()
+            ):
+                self._cache.move_to_end(template_name)
+                return cached
+
+        compiled = self._compile(template_name, path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            self._cache[template_name] = compiled
+            self._cache.move_to_end(template_name)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return compiled
+
+    def invalidate(self, template_name: Optional[str] = None):
+        with self._lock:
+            if template_name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(template_name, None)
+
+    def _compile(
+        self, template_name: str, path: str, mtime_ns: int, size: int
+    ) -> CompiledTemplate:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        front_matter, template_source = split_front_matter(text)
+        template_source, assets = self.inliner.inline(template_source)
+
+        if not template_source:
+            template = self.env.get_template(template_name)
+        else:
+            template = self.env.from_string(template_source)
+
+        # the hash covers everything the output depends on, so render keys
+        # change with included templates and inlined assets too
+        digest = hashlib.sha256((text + template_source).encode("utf-8"))
+        dependencies = dict(assets)
+        dependencies.update(self._referenced_templates(template_source))
+        for dependency in sorted(dependencies):
+            try:
+                with open(dependency, "rb") as f:
+                    content = f.read()
+            except OSError:
+                content = b""
+            digest.update(b"\0" + dependency.encode("utf-8") + b"\0")
+            digest.update(hashlib.sha256(content).digest())
+        return CompiledTemplate(
+            name=template_name,
+            template=template,
+            front_matter=front_matter,
+            mtime_ns=mtime_ns,
+            size=size,
+            sha256=digest.hexdigest(),
+            assets=dependencies,
+        )
+
+    def _referenced_templates(self, source: str) -> Dict[str, int]:
+        """
+        Path -> mtime_ns of the templates pulled in by `{% include %}`,
+        `{% extends %}` and `{% import %}`, recursively. Names computed at
+        render time can't be resolved and are skipped.
+        """
+        referenced: Dict[str, int] = {}
+        pending = [source]
+        while pending:
+            try:
+                names = meta.find_referenced_templates(self.env.parse(pending.pop()))
+            except TemplateSyntaxError:
+                continue
+            for name in names:
+                if name is None:
+                    continue
+                path = os.path.join(self.template_folder, name)
+                if path in referenced:
+                    continue
+                try:
+                    referenced[path] = os.stat(path).st_mtime_ns
+                    with open(path, "r", encoding="utf-8") as f:
+                        pending.append(f.read())
+                except OSError:
+                    continue
+        return referenced
+
+
+@dataclass
+class TemplateMetadata:
+    name: str
+    variables: Dict[str, TemplateVariable]
+    sha256: str
+    size: int
+    mtime_ns: int
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+
+class TemplateIndex:
+    """
+    In-memory index of the templates folder.
+
+    Holds the parsed variables, hash and size of every template so that the
+    listing and variables endpoints never touch the disk. The index is built
+    on startup and kept up to date by polling file mtimes in the background.
+    """
+
+    def __init__(self, template_folder: str, poll_interval: float = 2.0):
+        self.template_folder = template_folder
+        self.poll_interval = poll_interval
+        self._entries: Dict[str, TemplateMetadata] = {}
+        self._list_etag = '""'
+        self._lock = threading.Lock()
+        self._watch_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def list_etag(self) -> str:
+        return self._list_etag
+
+    def list_templates(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, template_name: str) -> Optional[TemplateMetadata]:
+        return self._entries.get(template_name)
+
+    def refresh(self) -> bool:
+        """Rescan the templates folder, re-reading only changed files. Returns True if anything changed."""
+        with self._lock:
+            entries: Dict[str, TemplateMetadata] = {}
+            changed = False
+            with os.scandir(self.template_folder) as it:
+                for entry in sorted(it, key=lambda e: e.name):
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    current = self._entries.get(entry.name)
+                    if (
+                        current
+                        and current.mtime_ns == stat.st_mtime_ns
+                        and current.size == stat.st_size
+                    ):
+                        entries[entry.name] = current
+                        continue
+                    entries[entry.name] = self._load(entry.path, entry.name, stat)
+                    changed = True
+
+            if changed or entries.keys() != self._entries.keys():
+                digest = hashlib.sha256()
+                for name, metadata in entries.items():
+                    digest.update(f"{name}:{metadata.sha256}\n".encode("utf-8"))
+                self._entries = entries
+                self._list_etag = f'"{digest.hexdigest()}"'
+                return True
+            return False
+
+    async def start(self):
+        await asyncio.to_thread(self.refresh)
+        self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                if await asyncio.to_thread(self.refresh):
+                    logger.info("Template index refreshed")
+            except Exception:
+                logger.exception("Failed to refresh the template index")
+
+    def _load(self, path: str, name: str, stat: os.stat_result) -> TemplateMetadata:
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            front_matter, _ = split_front_matter(data.decode("utf-8"))
+            variables = parse_template_variables(front_matter)
+        except UnicodeDecodeError:
+            variables = {}
+        return TemplateMetadata(
+            name=name,
+            variables=variables,
+            sha256=hashlib.sha256(data).hexdigest(),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+        )
@@ -1,45 +1,41 @@
 from pydantic import HttpUrl
-from typing import Optional, Literal
-import os
-import base64
-import mimetypes
+from typing import Callable, Optional, Literal
 from app.models.cv_item import CvItem
 
+DEFAULT_ICONS = {
+    "website": "icons/website.png",
+    "github": "icons/github.png",
+    "linkedin": "icons/linkedin.png",
+}
+
+# turns an icon path into a data URI; installed by app.core.assets so the
+# models don't depend on the rendering code
+_icon_resolver: Optional[Callable[[str], Optional[str]]] = None
+
+
+def set_icon_resolver(resolver: Optional[Callable[[str], Optional[str]]]):
+    global _icon_resolver
+    _icon_resolver = resolver
+
 
 class Link(CvItem):
     label: str = ""
     url: HttpUrl = HttpUrl("https://example.com")
     link_type: Literal["website", "github", "linkedin"] = "website"
 
+    @property
+    def link_icon_path(self) -> Optional[str]:
+        """Path of the icon for this link type, relative to the `documents` folder."""
+        return DEFAULT_ICONS.get(self.link_type)
+
     @property
     def link_icon(self) -> Optional[str]:
         """
-        Return a data URI for the icon if the corresponding file exists under the
-        repository's `documents` folder. Falls back to the relative path (e.g.
-        `icons/github.png`) if the file can't be read. This keeps templates
-        unchanged while making icons renderable even when no static server is
-        available.
+        Return a data URI for the icon, so templates can embed it even when no
+        static server is available. Falls back to the relative path (e.g.
+        `icons/github.png`) if the file can't be read.
         """
-        default_icons = {
-            "website": "icons/website.png",
-            "github": "icons/github.png",
-            "linkedin": "icons/linkedin.png",
-        }
-        rel_path = default_icons.get(self.link_type)
-        if not rel_path:
-            return None
-
-        candidate = os.path.abspath(os.path.join("documents", rel_path))
-        try:
-            if os.path.exists(candidate) and os.path.isfile(candidate):
-                mime, _ = mimetypes.guess_type(candidate)
-                if not mime:
-                    mime = "application/octet-stream"
-                with open(candidate, "rb") as f:
-                    data = f.read()
-                b64 = base64.b64encode(data).decode("ascii")
-                return f"data:{mime};base64,{b64}"
-        except Exception:
-            pass
-
-        return rel_path
+        rel_path = self.link_icon_path
+        if not rel_path or _icon_resolver is None:
+            return rel_path
+        return _icon_resolver(rel_path) or rel_path
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, EmailStr, PrivateAttr
+from typing import Any, Dict, List, Optional, Tuple, Type, get_args
 from datetime import date
 
 import yaml
@@ -17,6 +17,17 @@ ResumeElement: TypeAlias = Union[
     Link, Skill, Experience, Education, Certification, Project, Language
 ]
 
+# top-level fields holding lists of CvItems, addressable by item id
+RESUME_COLLECTIONS = (
+    "links",
+    "skills",
+    "experience",
+    "education",
+    "certifications",
+    "projects",
+    "languages",
+)
+
 
 class Resume(BaseModel):
     id: str = Field(default_factory=lambda: short_id("res_"))
@@ -38,68 +49,157 @@ class Resume(BaseModel):
     languages: List[Language] = Field(default_factory=list[Language])
     schema_version: int = 1
 
-    def visible_only(self) -> "Resume":
+    # element id -> (collection, index), built on first lookup and kept up
+    # to date by the element methods
+    _element_index: Optional[Dict[str, Tuple[str, int]]] = PrivateAttr(default=None)
+
+    @classmethod
+    def element_type(cls, collection: str) -> Type[ResumeElement]:
+        """The CvItem model stored in a collection, e.g. Experience for "experience"."""
+        if collection not in RESUME_COLLECTIONS:
+            raise KeyError(collection)
+        return get_args(cls.model_fields[collection].annotation)[0]
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in RESUME_COLLECTIONS:
+            self._element_index = None
+
+    def _build_element_index(self) -> Dict[str, Tuple[str, int]]:
+        self._element_index = {
+            element.id: (collection, index)
+            for collection in RESUME_COLLECTIONS
+            for index, element in enumerate(getattr(self, collection))
+        }
+        return self._element_index
+
+    def _reindex(self, collection: str, start: int = 0):
+        """Refresh the index entries of a collection's elements from `start` on."""
+        if self._element_index is None:
+            return
+        elements = getattr(self, collection)
+        for index in range(max(start, 0), len(elements)):
+            self._element_index[elements[index].id] = (collection, index)
+
+    def find_element(self, element_id: str) -> Optional[Tuple[str, int]]:
+        """Return the (collection, index) of an element, or None if there's none with that id."""
+        if not isinstance(element_id, str):
+            return None
+        element_index = self._element_index
+        if element_index is not None:
+            location = element_index.get(element_id)
+            if location is not None:
+                collection, index = location
+                elements = getattr(self, collection)
+                if index < len(elements) and elements[index].id == element_id:
+                    return location
+        # first lookup, or the lists were changed in place: rebuild
+        return self._build_element_index().get(element_id)
+
+    def get_element_by_id(self, element_id: str) -> Optional[ResumeElement]:
+        location = self.find_element(element_id)
+        if location is None:
+            return None
+        collection, index = location
+        return getattr(self, collection)[index]
+
+    def _touch(self):
+        self.updated_at = date.today()
+
+    def visible_only(self) -> "ResumeView":
         """
-        Return a deep copy of this Resume where each top-level collection
-        contains only items with visible == True.
-        Items without an visible attribute are kept by default.
+        Return a view of this Resume whose collections contain only items
+        with visible == True; items without a visible attribute are kept.
+        Nothing is copied. Take a new view after changing the resume.
         """
-        filtered = self.model_copy(deep=True)
-        filtered.links = [
-            link for link in filtered.links if getattr(link, "visible", True)
-        ]
-        filtered.skills = [
-            skill for skill in filtered.skills if getattr(skill, "visible", True)
-        ]
-        filtered.experience = [
-            experience_item
-            for experience_item in filtered.experience
-            if getattr(experience_item, "visible", True)
-        ]
-        filtered.education = [
-            education_item
-            for education_item in filtered.education
-            if getattr(education_item, "visible", True)
-        ]
-        filtered.certifications = [
-            certification
-            for certification in filtered.certifications
-            if getattr(certification, "visible", True)
-        ]
-        filtered.projects = [
-            project
-            for project in filtered.projects
-            if getattr(project, "visible", True)
-        ]
-        filtered.languages = [
-            language
-            for language in filtered.languages
-            if getattr(language, "visible", True)
-        ]
-        return filtered
+        return ResumeView(self)
 
     def update_element_by_id(self, element_id: str, new_element: ResumeElement) -> bool:
         """
-        Update an element in the resume by its ID.
+        Replace an element in the resume by its ID; the new element keeps that ID.
         Returns True if the element was found and updated, False otherwise.
+        Raises TypeError if the new element doesn't belong in the element's
+        collection, e.g. a Link replacing an Experience.
+        """
+        location = self.find_element(element_id)
+        if location is None:
+            return False
+        collection, index = location
+        element_type = self.element_type(collection)
+        if not isinstance(new_element, element_type):
+            raise TypeError(
+                f"Element {element_id} is in {collection}, which holds "
+                f"{element_type.__name__} elements, not {type(new_element).__name__}"
+            )
+        getattr(self, collection)[index] = new_element.model_copy(
+            update={"id": element_id}
+        )
+        self._touch()
+        return True
+
+    def patch_element(
+        self, element_id: str, changes: Dict[str, Any]
+    ) -> Optional[ResumeElement]:
+        """
+        Update some fields of an element, validating the result. Returns the
+        updated element, or None if there's no element with that ID. Raises
+        ValueError for fields the element doesn't have.
         """
-        collections = [
-            self.links,
-            self.skills,
-            self.experience,
-            self.education,
-            self.certifications,
-            self.projects,
-            self.languages,
-        ]
-
-        for collection in collections:
-            for idx, element in enumerate(collection):
-                if getattr(element, "id", None) == element_id:
-                    collection[idx] = new_element
-                    self.updated_at = date.today()
-                    return True
-        return False
+        location = self.find_element(element_id)
+        if location is None:
+            return None
+        collection, index = location
+        elements = getattr(self, collection)
+        unknown = sorted(set(changes) - set(type(elements[index]).model_fields))
+        if unknown:
+            raise ValueError(
+                f"Unknown {collection} fields: {', '.join(map(str, unknown))}"
+            )
+        data = {**elements[index].model_dump(), **changes, "id": element_id}
+        elements[index] = type(elements[index]).model_validate(data)
+        self._touch()
+        return elements[index]
+
+    def insert_element(
+        self, collection: str, data: Dict[str, Any], index: Optional[int] = None
+    ) -> ResumeElement:
+        """Validate `data` as an element of `collection` and insert it at `index` (default: last)."""
+        element = self.element_type(collection).model_validate(data)
+        if self.find_element(element.id) is not None:
+            raise ValueError(f"Duplicate element id {element.id}")
+        elements = getattr(self, collection)
+        if index is None:
+            index = len(elements)
+        elements.insert(index, element)
+        # list.insert clamps the index, and a negative one counts from the
+        # end: reindex the whole collection then
+        self._reindex(collection, min(index, len(elements) - 1) if index >= 0 else 0)
+        self._touch()
+        return element
+
+    def delete_element(self, element_id: str) -> bool:
+        location = self.find_element(element_id)
+        if location is None:
+            return False
+        collection, index = location
+        del getattr(self, collection)[index]
+        if self._element_index is not None:
+            del self._element_index[element_id]
+        self._reindex(collection, index)
+        self._touch()
+        return True
+
+    def move_element(self, element_id: str, index: int) -> bool:
+        """Move an element to `index` within its collection."""
+        location = self.find_element(element_id)
+        if location is None:
+            return False
+        collection, current = location
+        elements = getattr(self, collection)
+        elements.insert(index, elements.pop(current))
+        self._reindex(collection, min(current, index) if index >= 0 else 0)
+        self._touch()
+        return True
 
     def dump_to_yaml_string(self) -> str:
         data = self.model_dump(mode="json", exclude_none=True)
@@ -109,3 +209,46 @@ class Resume(BaseModel):
     def load_from_yaml_string(cls, yaml_string: str) -> "Resume":
         data = yaml.safe_load(yaml_string) or {}
         return cls.model_validate(data)
+
+
+class ResumeView:
+    """
+    Read-only view of a Resume without its hidden items.
+
+    Attributes are read from the resume itself, except collections, which are
+    filtered on first access and then reused for the life of the view, e.g.
+    one render.
+    """
+
+    __slots__ = ("resume", "_collections")
+
+    def __init__(self, resume: Resume):
+        self.resume = resume
+        # collection -> visible items
+        self._collections: Dict[str, List[Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # keeps copy and pickle from looking up unset slots through here
+            raise AttributeError(name)
+        value = getattr(self.resume, name)
+        if name not in RESUME_COLLECTIONS:
+            return value
+
+        visible = self._collections.get(name)
+        if visible is None:
+            visible = [item for item in value if getattr(item, "visible", True)]
+            self._collections[name] = visible
+        return visible
+
+    def to_resume(self) -> Resume:
+        """A Resume with the visible items; items are shared, not copied."""
+        return self.resume.model_copy(
+            update={name: getattr(self, name) for name in RESUME_COLLECTIONS}
+        )
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.to_resume().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        return self.to_resume().model_dump_json(**kwargs)
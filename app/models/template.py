@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Any, List, Literal, Optional
+
+
+class TemplateVariable(BaseModel):
+    type: Literal[
+        "text",
+        "select",
+        "multiselect",
+        "checkbox",
+        "bool",
+        "number",
+        "textarea",
+        "color",
+    ] = "text"
+    default: Optional[Any] = None
+    options: Optional[List[Any]] = None
+    label: Optional[str] = None
+    description: Optional[str] = None
@@ -1,37 +1,43 @@
 from typing import Dict, List
 from pydantic_ai import ModelMessage, ModelMessagesTypeAdapter
+from pydantic_ai.messages import TextPart, UserPromptPart
+from app.pages.ui_utils.api_client import get_api_client, list_resumes
 import streamlit as st
-import requests
+import json
+import time
+
+# minimum seconds between two markdown re-renders while streaming
+RENDER_INTERVAL = 0.1
 
 
 def from_pydantic_to_openai(messages: List[ModelMessage]) -> List[Dict[str, str]]:
     openai_messages: List[Dict[str, str]] = []
     for message in messages:
-        parts = message.parts
-        for part in parts:
-            if part.part_kind == "user-prompt":
-                openai_messages.append({"role": "user", "content": part.content or ""})
-            elif part.part_kind == "system-prompt":
-                continue
-            elif part.part_kind == "text":
-                openai_messages.append(
-                    {"role": "assistant", "content": part.content or ""}
-                )
+        for part in message.parts:
+            if isinstance(part, UserPromptPart):
+                content = part.content
+                if not isinstance(content, str):
+                    # multimodal prompt: show its text
+                    content = " ".join(
+                        item for item in content if isinstance(item, str)
+                    )
+                openai_messages.append({"role": "user", "content": content})
+            elif isinstance(part, TextPart):
+                openai_messages.append({"role": "assistant", "content": part.content})
     return openai_messages
 
 
 st.title("Chat")
 
-options = requests.get("http://127.0.0.1:8000/resume/list").json()
+api = get_api_client()
+options = list_resumes()
 selected = st.selectbox("Choose from your resumes", options=options)
 
 conversation_id = f"chat_{selected}"
 # TODO: Add resume selection to context
 
 if "messages" not in st.session_state:
-    messages = requests.get(
-        f"http://127.0.0.1:8000/memory/conversations/{conversation_id}/messages"
-    ).json()
+    messages = api.get(f"/memory/conversations/{conversation_id}/messages").json()
     pydantic_messages = ModelMessagesTypeAdapter.validate_python(messages)
     openai_messages = from_pydantic_to_openai(pydantic_messages)
     st.session_state.messages = openai_messages
@@ -46,23 +52,55 @@ if prompt:
         st.markdown(prompt)
 
     with st.chat_message("assistant"):
-        stream = requests.post(
-            "http://127.0.0.1:8000/chat/",
-            json={
+        activity_placeholder = st.empty()
+        message_placeholder = st.empty()
+        stats_placeholder = st.empty()
+        full_text = ""
+        rendered_text = ""
+        last_render = 0.0
+        time_to_first_token = None
+        started_at = time.perf_counter()
+
+        lines = api.stream_lines(
+            "/chat/",
+            {
                 "request": prompt,
                 "conversation_id": conversation_id,
                 "resume_name": selected,
             },
-            stream=True,
         )
-        message_placeholder = st.empty()
-        full_text = ""
-        for chunk in stream.iter_content(decode_unicode=True):
-            if chunk:
-                if isinstance(chunk, bytes):
-                    chunk = chunk.decode("utf-8", errors="replace")
-                full_text += chunk
+        for line in lines:
+            if not line:
+                continue
+            event = json.loads(line)
+            event_type = event["type"]
+            data = event.get("data", {})
+
+            if event_type == "text_delta":
+                if time_to_first_token is None:
+                    time_to_first_token = time.perf_counter() - started_at
+                full_text += data.get("text", "")
+            elif event_type in ("tool_call_start", "subagent_start"):
+                activity_placeholder.caption(f"⚙️ Running {data.get('tool_name')}...")
+            elif event_type in ("tool_call_end", "subagent_end"):
+                activity_placeholder.empty()
+            elif event_type == "error":
+                st.error(data.get("message") or "The assistant failed to respond.")
+
+            # batch markdown re-renders instead of redrawing on every event
+            now = time.perf_counter()
+            if full_text != rendered_text and now - last_render >= RENDER_INTERVAL:
                 message_placeholder.markdown(full_text)
+                rendered_text = full_text
+                last_render = now
+
+        activity_placeholder.empty()
+        message_placeholder.markdown(full_text)
+        if time_to_first_token is not None:
+            stats_placeholder.caption(
+                f"First token after {time_to_first_token:.2f}s, "
+                f"completed in {time.perf_counter() - started_at:.2f}s"
+            )
 
     st.session_state.messages.append({"role": "user", "content": prompt})
     st.session_state.messages.append({"role": "assistant", "content": full_text})
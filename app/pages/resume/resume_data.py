@@ -8,8 +8,13 @@ from app.models.skill import Skill
 from app.models.certification import Certification
 from app.models.project import Project
 from app.models.langauge import Language
+from app.pages.ui_utils.api_client import (
+    get_api_client,
+    list_resumes,
+    save_resume,
+    upload_resume,
+)
 from app.pages.ui_utils.section_renderer import render_pydantic_section
-import requests
 
 
 def load_default_resume() -> Resume:
@@ -42,6 +47,9 @@ def get_resume_with_current_data() -> Resume:
 
 if "resume" not in st.session_state:
     st.session_state["resume"] = None
+    # file and revision the edits are based on, for If-Match when saving
+    st.session_state["resume_file"] = None
+    st.session_state["resume_etag"] = None
 
 st.markdown("# Resume Data")
 
@@ -54,6 +62,8 @@ if st.session_state["resume"] is None:
     if resume_source == "Create new":
         if st.button("Start new resume"):
             st.session_state["resume"] = load_default_resume()
+            st.session_state["resume_file"] = None
+            st.session_state["resume_etag"] = None
             keys_to_clear = [
                 key
                 for key in st.session_state.keys()
@@ -64,12 +74,14 @@ if st.session_state["resume"] is None:
             st.rerun()
 
     elif resume_source == "Select existing":
-        options = requests.get("http://127.0.0.1:8000/resume/list").json()
+        options = list_resumes()
         selected = st.selectbox("Choose from your resumes", options=options)
         if selected and st.button("Load selected"):
-            response = requests.get(f"http://127.0.0.1:8000/resume/{selected}")
+            response = get_api_client().get(f"/resume/{selected}")
             if response.status_code == 200:
                 st.session_state["resume"] = Resume(**response.json())
+                st.session_state["resume_file"] = selected
+                st.session_state["resume_etag"] = response.headers.get("ETag")
             else:
                 st.error("Failed to load resume.")
             keys_to_clear = [
@@ -84,19 +96,17 @@ if st.session_state["resume"] is None:
     elif resume_source == "Upload file":
         uploaded_file = st.file_uploader("Upload YAML", type=["yml", "yaml"])
         if uploaded_file and st.button("Load uploaded file"):
-            response = requests.post(
-                "http://127.0.0.1:8000/resume/upload", files={"file": uploaded_file}
-            )
+            response = upload_resume(uploaded_file)
             if response.status_code != 200:
                 st.error("Failed to upload resume.")
 
-            response = requests.get(
-                f"http://127.0.0.1:8000/resume/{uploaded_file.name}"
-            )
+            response = get_api_client().get(f"/resume/{uploaded_file.name}")
 
             if response.status_code != 200:
                 st.error("Failed to load uploaded resume.")
             st.session_state["resume"] = Resume(**response.json())
+            st.session_state["resume_file"] = uploaded_file.name
+            st.session_state["resume_etag"] = response.headers.get("ETag")
             keys_to_clear = [
                 key
                 for key in st.session_state.keys()
@@ -137,18 +147,28 @@ else:
     col1, col2 = st.columns([1, 1])
     with col1:
         if st.button("💾 Save Resume"):
-            response = requests.post(
-                "http://127.0.0.1:8000/resume/save",
-                json={"resume": get_resume_with_current_data()},
+            response = save_resume(
+                current_resume.model_dump(mode="json"),
+                st.session_state.get("resume_etag"),
+                st.session_state.get("resume_file"),
             )
             if response.status_code == 200:
+                st.session_state["resume_file"] = current_resume.name + ".yaml"
+                st.session_state["resume_etag"] = response.headers.get("ETag")
                 st.success("Resume saved successfully!")
+            elif response.status_code == 412:
+                st.error(
+                    "The resume was changed elsewhere since you loaded it. "
+                    "Reload it before saving."
+                )
             else:
                 st.error("Failed to save resume.")
 
     with col2:
         if st.button("↩ Back to source selection"):
             st.session_state["resume"] = None
+            st.session_state["resume_file"] = None
+            st.session_state["resume_etag"] = None
             keys_to_clear = [
                 key
                 for key in st.session_state.keys()
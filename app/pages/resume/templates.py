@@ -1,31 +1,14 @@
 import streamlit as st
-import asyncio
-import sys
 import io
-from typing import Dict, Optional, Any, List, Literal
-from pydantic import BaseModel
-import requests
-
-
-if sys.platform.startswith("win"):
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-
-class TemplateVariable(BaseModel):
-    type: Literal[
-        "text",
-        "select",
-        "multiselect",
-        "checkbox",
-        "bool",
-        "number",
-        "textarea",
-        "color",
-    ] = "text"
-    default: Optional[Any] = None
-    options: Optional[List[Any]] = None
-    label: Optional[str] = None
-    description: Optional[str] = None
+import base64
+from typing import Dict, Any
+from app.models.template import TemplateVariable
+from app.pages.ui_utils.api_client import (
+    get_api_client,
+    get_template_variables,
+    list_resumes,
+    list_templates,
+)
 
 
 def create_input_widget(key: str, definition: TemplateVariable):
@@ -62,16 +45,15 @@ def create_input_widget(key: str, definition: TemplateVariable):
 st.title("Templates & Export")
 
 st.subheader("Provide Resume YAML")
-resume_options = requests.get("http://127.0.0.1:8000/resume/list").json()
+api = get_api_client()
+resume_options = list_resumes()
 selected_resume = st.selectbox("Choose from your resumes", options=resume_options)
 
 st.subheader("Select Template")
-template_options = requests.get("http://127.0.0.1:8000/template/list").json()
+template_options = list_templates()
 selected_template = st.selectbox("Choose from your templates", options=template_options)
 
-template_variable_definitions = requests.get(
-    f"http://127.0.0.1:8000/template/{selected_template}/variables"
-).json()
+template_variable_definitions = get_template_variables(selected_template)
 template_variable_definitions = {
     key: TemplateVariable.model_validate(value)
     for key, value in template_variable_definitions.items()
@@ -89,15 +71,19 @@ st.subheader("Preview")
 
 if st.button("Render Preview"):
     with st.spinner("Rendering template and generating PDF..."):
-        html = requests.post(
-            f"http://127.0.0.1:8000/template/{selected_template}/render/{selected_resume}",
+        # one round trip for both outputs; the job queue is for batch exports
+        response = api.post(
+            f"/template/{selected_template}/render/{selected_resume}/bundle",
             json={"template_variables": template_variable_values},
-        ).json()["html"]
+            timeout=(api.config.timeout, api.config.stream_timeout),
+        )
 
-        pdf_bytes = requests.post(
-            f"http://127.0.0.1:8000/template/{selected_template}/render/{selected_resume}/pdf",
-            json={"template_variables": template_variable_values},
-        ).content
+    if response.status_code != 200:
+        st.error(f"Rendering failed: {response.text}")
+    else:
+        bundle = response.json()
+        html = bundle["html"]
+        pdf_bytes = base64.b64decode(bundle["pdf_base64"])
 
         st.pdf(io.BytesIO(pdf_bytes))
         st.download_button(
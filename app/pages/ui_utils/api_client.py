@@ -0,0 +1,117 @@
+from pydantic_settings import BaseSettings
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, List, Optional
+import requests
+import streamlit as st
+
+
+class FrontendConfig(BaseSettings):
+    api_url: str = "http://127.0.0.1:8000"
+    timeout: float = 10.0
+    # chat streams and renders can go quiet for a while between chunks
+    stream_timeout: float = 300.0
+    cache_ttl: float = 30.0
+
+    class Config:
+        env_prefix = "FRONTEND_"
+        env_file = ".env"
+
+
+CONFIG = FrontendConfig()
+
+
+class ApiClient:
+    """
+    Client of the ResuMate API shared by every page and script rerun.
+
+    A single requests session keeps connections to the backend alive across
+    reruns, and every call gets a timeout so a stuck backend can't hang the UI.
+    """
+
+    def __init__(self, config: FrontendConfig):
+        self.config = config
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.config.timeout)
+        return self.session.request(
+            method, self.config.api_url.rstrip("/") + path, **kwargs
+        )
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def stream_lines(self, path: str, payload: Dict[str, Any]) -> Iterator[str]:
+        with self.post(
+            path,
+            json=payload,
+            stream=True,
+            timeout=(self.config.timeout, self.config.stream_timeout),
+        ) as response:
+            # NDJSON is always UTF-8, whatever the response headers say
+            for line in response.iter_lines():
+                yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+@st.cache_resource
+def get_api_client() -> ApiClient:
+    return ApiClient(CONFIG)
+
+
+# Cached reads: Streamlit reruns the whole page on every interaction, these
+# endpoints change rarely. Writes clear the caches they affect, and failed
+# requests raise so that error bodies are never cached.
+
+
+def _get_json(path: str) -> Any:
+    response = get_api_client().get(path)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=CONFIG.cache_ttl, show_spinner=False)
+def list_resumes() -> List[str]:
+    return _get_json("/resume/list")
+
+
+@st.cache_data(ttl=CONFIG.cache_ttl, show_spinner=False)
+def list_templates() -> List[str]:
+    return _get_json("/template/list")
+
+
+@st.cache_data(ttl=CONFIG.cache_ttl, show_spinner=False)
+def get_template_variables(template_name: str) -> Dict[str, Any]:
+    return _get_json(f"/template/{template_name}/variables")
+
+
+def invalidate_resumes():
+    list_resumes.clear()
+
+
+def save_resume(
+    resume_data: Dict[str, Any],
+    etag: Optional[str] = None,
+    loaded_file: Optional[str] = None,
+) -> requests.Response:
+    """
+    Save a resume. `etag` is sent as If-Match only if the resume is saved to
+    the file it was loaded from (`loaded_file`): the API saves to
+    `<name>.yaml`, so a renamed or uploaded resume goes to another file.
+    """
+    same_file = loaded_file == f"{resume_data.get('name')}.yaml"
+    headers = {"If-Match": etag} if etag and same_file else {}
+    response = get_api_client().post("/resume/save", json=resume_data, headers=headers)
+    invalidate_resumes()
+    return response
+
+
+def upload_resume(file: Any) -> requests.Response:
+    response = get_api_client().post("/resume/upload", files={"file": file})
+    invalidate_resumes()
+    return response
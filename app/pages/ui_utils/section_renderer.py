@@ -1,9 +1,23 @@
 import streamlit as st
 from pydantic import BaseModel, HttpUrl
 from pydantic.fields import FieldInfo
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Type, List, Any, Union, get_origin, get_args, Literal, Dict, Optional
+from functools import lru_cache
+from typing import (
+    Type,
+    List,
+    Any,
+    Union,
+    get_origin,
+    get_args,
+    Literal,
+    Dict,
+    Optional,
+    Tuple,
+)
 from enum import Enum
+import math
 from app.pages.ui_utils.field_renderers import (
     render_text_area,
     render_text_input,
@@ -12,6 +26,10 @@ from app.pages.ui_utils.field_renderers import (
 )
 
 
+# items listed per page of a section
+SECTION_PAGE_SIZE = 10
+
+
 def is_optional(field: FieldInfo) -> bool:
     """Check if a field is Optional[...]"""
     if get_origin(field.annotation) is Union:
@@ -85,12 +103,65 @@ def get_field_type(field: FieldInfo) -> str:
     return "unknown"
 
 
-def render_field_widget(
-    field_name: str, field: FieldInfo, current_value: Any, widget_key: str
-) -> Union[str, int, float, bool, date, datetime, HttpUrl, list[str], None]:
-    """Render a widget based on normalized field type."""
+@dataclass(frozen=True)
+class FieldPlan:
+    """Everything needed to render the widget of a field, computed once."""
+
+    name: str
+    field: FieldInfo
+    field_type: str
+    label: str
+    optional: bool
+    # selectbox options of enum and literal fields
+    options: Tuple[Any, ...] = ()
+
+
+def plan_field(field_name: str, field: FieldInfo) -> FieldPlan:
     field_type = get_field_type(field)
-    field_label = field_name.replace("_", " ").title()
+    optional = is_optional(field)
+
+    options: List[Any] = []
+    if field_type == "enum" and field.annotation is not None:
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = next(a for a in get_args(annotation) if a is not type(None))
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            options = list(annotation.__members__.values())
+    elif field_type == "literal":
+        options = extract_literal_choices(field.annotation)
+    if optional and field_type in ["enum", "literal"]:
+        options = [""] + options
+
+    return FieldPlan(
+        name=field_name,
+        field=field,
+        field_type=field_type,
+        label=field_name.replace("_", " ").title(),
+        optional=optional,
+        options=tuple(options),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_form_plan(model: Type[BaseModel]) -> Tuple[FieldPlan, ...]:
+    """
+    The widgets of a model's form, in field order. Type introspection runs
+    once per model class instead of once per field on every rerun.
+    """
+    return tuple(
+        plan_field(field_name, field)
+        for field_name, field in model.model_fields.items()
+        if field_name != "schema_version"
+    )
+
+
+def render_planned_widget(
+    plan: FieldPlan, current_value: Any, widget_key: str
+) -> Union[str, int, float, bool, date, datetime, HttpUrl, list[str], None]:
+    """Render the widget of a planned field."""
+    field = plan.field
+    field_type = plan.field_type
+    field_label = plan.label
 
     if current_value is None:
         current_value = field.default if field.default is not ... else None
@@ -139,19 +210,12 @@ def render_field_widget(
             return current_value
 
     elif field_type in ["enum", "literal"]:
-        if field_type == "enum" and field.annotation is not None:
-            options = list(field.annotation.__members__.values())
-        else:  # literal
-            options = extract_literal_choices(field.annotation)
-
-        if is_optional(field):
-            options = [""] + options
-
+        options = plan.options
         default_index = options.index(current_value) if current_value in options else 0
         selected = st.selectbox(
             field_label, options, index=default_index, key=widget_key
         )
-        return None if is_optional(field) and selected == "" else selected
+        return None if plan.optional and selected == "" else selected
 
     elif field_type == "list_str":
         text_value = "\n".join(current_value or [])
@@ -174,8 +238,13 @@ def initialize_section_data(section_key: str, model: Type[BaseModel], resume_obj
                 item.model_dump() if hasattr(item, "model_dump") else item.__dict__
                 for item in current_data
             ]
+            # the resume's items are valid as they are
+            st.session_state[f"{section_key}_objects"] = list(current_data)
         else:
             st.session_state[f"{section_key}_data"] = []
+            st.session_state[f"{section_key}_objects"] = []
+        st.session_state[f"{section_key}_open"] = set()
+        st.session_state[f"{section_key}_page"] = 1
 
 
 def get_section_data(section_key: str) -> List[Dict[str, Any]]:
@@ -192,19 +261,86 @@ def add_section_item(section_key: str, model: Type[BaseModel]):
         else new_instance.__dict__
     )
     st.session_state[f"{section_key}_data"].append(new_data)
+    st.session_state[f"{section_key}_objects"].append(new_instance)
+
+    # show the new item, opened for editing
+    new_index = len(st.session_state[f"{section_key}_data"]) - 1
+    st.session_state.setdefault(f"{section_key}_open", set()).add(new_index)
+    st.session_state[f"{section_key}_filter"] = ""
+    st.session_state[f"{section_key}_page"] = new_index // SECTION_PAGE_SIZE + 1
 
 
 def delete_section_item(section_key: str, index: int):
     """Delete an item from a section."""
     st.session_state[f"{section_key}_data"].pop(index)
+    st.session_state[f"{section_key}_objects"].pop(index)
+
+    open_items = st.session_state.get(f"{section_key}_open", set())
+    st.session_state[f"{section_key}_open"] = {
+        i - 1 if i > index else i for i in open_items if i != index
+    }
+
+
+def toggle_section_item(section_key: str, index: int):
+    """Open a section item for editing, or close it."""
+    open_items = st.session_state.setdefault(f"{section_key}_open", set())
+    open_items.symmetric_difference_update({index})
+
+
+def filter_section_items(section_data: List[Dict[str, Any]], query: str) -> List[int]:
+    """Indices of the items with a value containing `query`, ignoring case."""
+    query = query.strip().lower()
+    if not query:
+        return list(range(len(section_data)))
+    return [
+        i
+        for i, item_data in enumerate(section_data)
+        if any(
+            query in str(value).lower()
+            for value in item_data.values()
+            if value is not None
+        )
+    ]
+
+
+def section_item_title(
+    title: str,
+    index: int,
+    item_data: Dict[str, Any],
+    form_plan: Tuple[FieldPlan, ...],
+    field_for_title: Optional[str] = None,
+) -> str:
+    """
+    Summary of an item: the `field_for_title` value, or else its first
+    non-empty text field.
+    """
+    if field_for_title and field_for_title in item_data:
+        return f"{title} {index + 1}: {item_data.get(field_for_title) or 'New'}"
+    for plan in form_plan:
+        value = item_data.get(plan.name)
+        if plan.field_type == "str" and plan.name != "id" and value:
+            return f"{title} {index + 1}: {value}"
+    return f"{title} {index + 1}"
 
 
 def section_data_to_pydantic_objects(
     section_key: str, model: Type[BaseModel]
 ) -> List[BaseModel]:
-    """Convert section data from session state back to Pydantic objects."""
+    """
+    Convert section data from session state back to Pydantic objects. Items
+    are validated again only if their data changed since the last call.
+    """
     data = get_section_data(section_key)
-    return [model(**item_data) for item_data in data]
+    objects: List[Optional[BaseModel]] = st.session_state.setdefault(
+        f"{section_key}_objects", []
+    )
+    objects.extend([None] * (len(data) - len(objects)))
+    del objects[len(data) :]
+
+    for i, item_data in enumerate(data):
+        if objects[i] is None:
+            objects[i] = model(**item_data)
+    return list(objects)  # type: ignore[arg-type]
 
 
 def render_pydantic_section(
@@ -233,32 +369,72 @@ def render_pydantic_section(
         setattr(resume_obj, section_key, [])
         return
 
-    for i, item_data in enumerate(section_data):
-        if field_for_title and field_for_title in item_data:
-            field_value = item_data.get(field_for_title, "")
-            expander_title = f"{title} {i+1}: {field_value or 'New'}"
-        else:
-            expander_title = f"{title} {i+1}"
+    form_plan = get_form_plan(model)
+    objects = st.session_state.setdefault(f"{section_key}_objects", [])
+    open_items = st.session_state.setdefault(f"{section_key}_open", set())
 
-        col1, col2 = st.columns([0.85, 0.15], vertical_alignment="top")
+    query = st.text_input(
+        f"Filter {title.lower()}",
+        key=f"{section_key}_filter",
+        placeholder="Type to filter by any field",
+    )
+    matches = filter_section_items(section_data, query)
+
+    # widgets are only created for the items on the current page; the
+    # page is clamped before its widget exists, since the filter may
+    # have shrunk the number of pages
+    pages = max(1, math.ceil(len(matches) / SECTION_PAGE_SIZE))
+    page_key = f"{section_key}_page"
+    st.session_state[page_key] = min(max(st.session_state.get(page_key, 1), 1), pages)
+    if pages > 1:
+        st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    start = (st.session_state[page_key] - 1) * SECTION_PAGE_SIZE
+    page_items = matches[start : start + SECTION_PAGE_SIZE]
+
+    counter = f"{len(section_data)} {title.lower()}"
+    if query.strip():
+        counter += f", {len(matches)} matching"
+    if page_items:
+        counter += f" · showing {start + 1}–{start + len(page_items)}"
+    st.caption(counter)
+
+    for i in page_items:
+        item_data = section_data[i]
+        item_title = section_item_title(title, i, item_data, form_plan, field_for_title)
+        is_open = i in open_items
+
+        col1, col2, col3 = st.columns([0.75, 0.1, 0.15], vertical_alignment="top")
 
         with col1:
-            with st.expander(expander_title, expanded=False):
-                for field_name, field in model.model_fields.items():
-                    if field_name == "schema_version":
-                        continue
-
-                    widget_key = f"{section_key}_{i}_{field_name}"
-                    current_value = item_data.get(field_name)
-
-                    new_value = render_field_widget(
-                        field_name, field, current_value, widget_key
-                    )
-
-                    st.session_state[f"{section_key}_data"][i][field_name] = new_value
+            if not is_open:
+                # collapsed items are summarized without creating their widgets
+                st.markdown(f"**{item_title}**")
+            else:
+                with st.container(border=True):
+                    st.markdown(f"**{item_title}**")
+                    for plan in form_plan:
+                        widget_key = f"{section_key}_{i}_{plan.name}"
+                        current_value = item_data.get(plan.name)
+
+                        new_value = render_planned_widget(
+                            plan, current_value, widget_key
+                        )
+
+                        if new_value != current_value:
+                            item_data[plan.name] = new_value
+                            if i < len(objects):
+                                objects[i] = None  # revalidated below
 
         with col2:
-            st.write("")
+            if st.button(
+                "✅" if is_open else "✏️",
+                key=f"edit_{section_key}_{i}",
+                help="Done editing" if is_open else f"Edit this {title.lower()}",
+            ):
+                toggle_section_item(section_key, i)
+                st.rerun()
+
+        with col3:
             if st.button(
                 "🗑️",
                 key=f"delete_{section_key}_{i}",
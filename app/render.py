@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+
+def _parse_variables(values):
+    variables = {}
+    for value in values:
+        name, _, raw = value.partition("=")
+        try:
+            variables[name] = json.loads(raw)
+        except json.JSONDecodeError:
+            variables[name] = raw
+    return variables
+
+
+def _write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+async def _run(args) -> int:
+    from app.api.dependencies.dependencies import (
+        get_async_storage,
+        get_render_pipeline,
+    )
+    from app.core.batch import BatchItemStatus, expand_batch, output_path, render_batch
+
+    storage = get_async_storage()
+    resumes = args.resume or sorted(await storage.list_resumes())
+    items = expand_batch(resumes, args.template, _parse_variables(args.var))
+
+    pipeline = get_render_pipeline()
+    await pipeline.start()
+    failed = 0
+    try:
+        async for result, artifact in render_batch(
+            pipeline, items, concurrency=args.concurrency
+        ):
+            if artifact is not None:
+                await asyncio.to_thread(
+                    _write,
+                    os.path.join(args.output, output_path(result, "pdf")),
+                    artifact.pdf or b"",
+                )
+                if args.html:
+                    await asyncio.to_thread(
+                        _write,
+                        os.path.join(args.output, output_path(result, "html")),
+                        artifact.html.encode("utf-8"),
+                    )
+            if result.status != BatchItemStatus.ok:
+                failed += 1
+            print(result.model_dump_json(), flush=True)
+    finally:
+        await pipeline.stop()
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render resumes with one or more templates in a single batch."
+    )
+    parser.add_argument(
+        "-t", "--template", action="append", required=True, help="template file name"
+    )
+    parser.add_argument(
+        "-r",
+        "--resume",
+        action="append",
+        default=[],
+        help="resume file name, defaults to every resume",
+    )
+    parser.add_argument(
+        "--var",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="template variable, the value is parsed as JSON when possible",
+    )
+    parser.add_argument("-o", "--output", default="documents/renders")
+    parser.add_argument("--html", action="store_true", help="also write the HTML")
+    parser.add_argument("--concurrency", type=int, default=4)
+    sys.exit(asyncio.run(_run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
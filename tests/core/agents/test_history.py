@@ -0,0 +1,73 @@
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from app.core.agents.history import HistoryCompactor, HistoryConfig, SUMMARY_PREFIX
+from app.core.memory import AsyncMemory, LocalMemory
+from typing import List
+import asyncio
+
+
+def _conversation(turns: int) -> List[ModelMessage]:
+    messages: List[ModelMessage] = []
+    for turn in range(turns):
+        messages.append(
+            ModelRequest(parts=[UserPromptPart(content=f"question {turn}")])
+        )
+        messages.append(ModelResponse(parts=[TextPart(content=f"answer {turn}")]))
+    return messages
+
+
+def _summarize(messages: List[ModelMessage], info: AgentInfo) -> ModelResponse:
+    return ModelResponse(parts=[TextPart(content="the summary")])
+
+
+def _fail(messages: List[ModelMessage], info: AgentInfo) -> ModelResponse:
+    raise RuntimeError("summarizer is down")
+
+
+def _compactor() -> HistoryCompactor:
+    return HistoryCompactor(HistoryConfig(max_turns=1, max_tokens=None))
+
+
+def test_compact_sends_unsummarized_turns_without_model_call():
+    memory = AsyncMemory(LocalMemory())
+    messages = _conversation(3)
+
+    assert asyncio.run(_compactor().compact("c", messages, memory)) == messages
+
+
+def test_update_summary_is_used_on_next_turn():
+    memory = AsyncMemory(LocalMemory())
+    compactor = _compactor()
+    messages = _conversation(3)
+
+    asyncio.run(
+        compactor.update_summary("c", messages, memory, FunctionModel(_summarize))
+    )
+
+    summary = asyncio.run(memory.get_summary("c"))
+    assert summary is not None and summary.message_count == 4
+    compacted = asyncio.run(compactor.compact("c", messages, memory))
+    head = compacted[0]
+    assert isinstance(head, ModelRequest)
+    part = head.parts[-1]
+    assert isinstance(part, SystemPromptPart)
+    assert part.content == SUMMARY_PREFIX + "the summary"
+    assert compacted[1:] == messages[4:]
+
+
+def test_failed_summary_falls_back_to_unsummarized_window():
+    memory = AsyncMemory(LocalMemory())
+    compactor = _compactor()
+    messages = _conversation(3)
+
+    asyncio.run(compactor.update_summary("c", messages, memory, FunctionModel(_fail)))
+
+    assert asyncio.run(memory.get_summary("c")) is None
+    assert asyncio.run(compactor.compact("c", messages, memory)) == messages
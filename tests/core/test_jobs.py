@@ -0,0 +1,76 @@
+from app.core.jobs import JobStatus, RenderJob, RenderJobConfig, RenderJobQueue
+from app.core.rendering import RenderArtifact, RenderNotFound
+import asyncio
+
+
+class FakePipeline:
+    """Renders "slow.yaml" until cancelled, and any other resume at once."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def render(self, template_name, resume_name, template_variables, pdf=True):
+        if resume_name == "missing.yaml":
+            return RenderNotFound("Resume not found")
+        if resume_name == "slow.yaml":
+            self.started.set()
+            await asyncio.sleep(60)
+        return RenderArtifact(id="0" * 64, html="<h1></h1>", content_hash="")
+
+
+async def _start(pipeline: FakePipeline) -> RenderJobQueue:
+    queue = RenderJobQueue(pipeline, RenderJobConfig(workers=1))  # type: ignore[arg-type]
+    await queue.start()
+    return queue
+
+
+async def _wait_finished(job: RenderJob):
+    while job.finished_at is None:
+        await asyncio.sleep(0.01)
+
+
+def test_stop_while_job_is_running():
+    async def run():
+        pipeline = FakePipeline()
+        queue = await _start(pipeline)
+        job = queue.submit("modern.html.j2", "slow.yaml")
+        await asyncio.wait_for(pipeline.started.wait(), timeout=1)
+
+        await asyncio.wait_for(queue.stop(), timeout=1)
+        return job
+
+    job = asyncio.run(run())
+    assert job.status == JobStatus.cancelled
+
+
+def test_cancel_running_job_keeps_worker_alive():
+    async def run():
+        pipeline = FakePipeline()
+        queue = await _start(pipeline)
+        cancelled = queue.submit("modern.html.j2", "slow.yaml")
+        await asyncio.wait_for(pipeline.started.wait(), timeout=1)
+
+        assert queue.cancel(cancelled.id)
+        # the only worker is still there to run the next job
+        done = queue.submit("modern.html.j2", "Jane Doe.yaml")
+        await asyncio.wait_for(_wait_finished(done), timeout=1)
+        assert queue.metrics().workers == 1
+        await asyncio.wait_for(queue.stop(), timeout=1)
+        return cancelled, done
+
+    cancelled, done = asyncio.run(run())
+    assert cancelled.status == JobStatus.cancelled
+    assert done.status == JobStatus.done and done.artifact is not None
+
+
+def test_not_found_fails_the_job():
+    async def run():
+        queue = await _start(FakePipeline())
+        job = queue.submit("modern.html.j2", "missing.yaml")
+        await asyncio.wait_for(_wait_finished(job), timeout=1)
+        await queue.stop()
+        return job
+
+    job = asyncio.run(run())
+    assert job.status == JobStatus.failed
+    assert job.error == "Resume not found" and job.artifact is None
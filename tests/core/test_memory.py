@@ -0,0 +1,103 @@
+from app.core.memory import ConversationSummary, LocalMemory, SQLiteMemory
+from pydantic_ai import ModelMessagesTypeAdapter
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
+from typing import List
+import pytest
+
+
+def _turn(question: str, answer: str) -> List[ModelMessage]:
+    return [
+        ModelRequest(parts=[UserPromptPart(content=question)]),
+        ModelResponse(parts=[TextPart(content=answer)]),
+    ]
+
+
+def _contents(messages: List[ModelMessage]) -> List[str]:
+    contents = []
+    for message in messages:
+        part = message.parts[0]
+        assert isinstance(part, (UserPromptPart, TextPart))
+        assert isinstance(part.content, str)
+        contents.append(part.content)
+    return contents
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = SQLiteMemory(str(tmp_path / "memory.db"))
+    yield memory
+    memory.close()
+
+
+def test_messages_survive_a_restart(tmp_path):
+    path = str(tmp_path / "memory.db")
+    memory = SQLiteMemory(path)
+    memory.add_messages("chat", _turn("Hello", "Hi!"))
+    memory.add_message("chat", ModelRequest(parts=[UserPromptPart(content="Thanks")]))
+    memory.close()
+
+    reopened = SQLiteMemory(path)
+    messages = reopened.get_messages("chat")
+    reopened.close()
+
+    assert isinstance(messages[0], ModelRequest)
+    assert isinstance(messages[1], ModelResponse)
+    assert _contents(messages) == ["Hello", "Hi!", "Thanks"]
+
+
+def test_conversation_payloads_validate_as_messages(memory):
+    memory.add_messages("chat", _turn("Hello", "Hi!"))
+
+    conversation = memory.get_conversation("chat")
+
+    assert _contents(ModelMessagesTypeAdapter.validate_python(conversation)) == [
+        "Hello",
+        "Hi!",
+    ]
+
+
+def test_pagination(memory):
+    memory.add_messages("chat", _turn("1", "2") + _turn("3", "4"))
+
+    assert _contents(memory.get_messages("chat", offset=1, limit=2)) == ["2", "3"]
+    assert _contents(memory.get_messages("chat", offset=3)) == ["4"]
+    assert memory.get_messages("other") == []
+
+
+def test_set_conversation_replaces_messages_and_summary(memory):
+    memory.add_messages("chat", _turn("Hello", "Hi!"))
+    memory.set_summary(
+        "chat", ConversationSummary(content="greetings", message_count=2)
+    )
+
+    memory.set_conversation("chat", _turn("Again", "Sure"))
+
+    assert _contents(memory.get_messages("chat")) == ["Again", "Sure"]
+    assert memory.get_summary("chat") is None
+
+
+def test_oldest_conversations_are_evicted(tmp_path):
+    memory = SQLiteMemory(str(tmp_path / "memory.db"), max_conversations=2)
+    for conversation_id in ("a", "b", "c"):
+        memory.add_messages(conversation_id, _turn("Hello", "Hi!"))
+
+    memory.evict()
+
+    assert memory.get_messages("a") == []
+    assert len(memory.get_messages("c")) == 2
+    memory.close()
+
+
+def test_local_memory_matches_sqlite(memory):
+    local = LocalMemory()
+    messages = _turn("Hello", "Hi!")
+    for store in (local, memory):
+        store.add_messages("chat", messages)
+
+    assert local.get_conversation("chat") == memory.get_conversation("chat")
@@ -0,0 +1,82 @@
+from app.core.preview import FragmentRenderer
+from app.core.templates import TemplateRegistry
+from app.models.resume import Resume
+from app.models.skill import Skill
+import pytest
+
+TEMPLATE = """---
+fragments:
+  intro: [name, title]
+---
+<body>{% block intro %}<h1>{{ resume.name }}, {{ resume.title }}</h1>{% endblock %}
+{% block skills %}<ul>{% for skill in resume.skills %}<li>{{ skill.name }}</li>{% endfor %}</ul>{% endblock %}
+{% block footer %}{{ variables.get('footer', '') }}{% endblock %}</body>
+"""
+
+
+@pytest.fixture
+def renderer(tmp_path) -> FragmentRenderer:
+    (tmp_path / "plain.html.j2").write_text(TEMPLATE)
+    return FragmentRenderer(TemplateRegistry(template_folder=str(tmp_path)))
+
+
+def _resume(**fields) -> Resume:
+    return Resume.model_validate(
+        {"name": "Jane", "date_of_birth": "2000-01-01", "title": "Dev", **fields}
+    )
+
+
+def _render(renderer, resume, variables=None, known=None, template_hash=None):
+    preview = renderer.render("plain.html.j2", resume, variables, known, template_hash)
+    assert preview is not None
+    return preview
+
+
+def test_first_render_includes_document_and_every_fragment(renderer):
+    preview = _render(renderer, _resume(skills=[Skill(name="SQL")]))
+
+    assert preview.html is not None and "<li>SQL</li>" in preview.html
+    assert set(preview.fragments) == {"intro", "skills", "footer"}
+    assert preview.fragments["intro"].html == "<h1>Jane, Dev</h1>"
+    assert preview.unchanged == []
+
+
+def test_only_fragments_depending_on_changed_fields_are_sent(renderer):
+    first = _render(renderer, _resume())
+    known = {name: fragment.hash for name, fragment in first.fragments.items()}
+
+    preview = _render(
+        renderer, _resume(skills=[Skill(name="SQL")]), None, known, first.template_hash
+    )
+
+    assert preview.html is None
+    # footer has no declared fields and isn't a resume field: it depends on everything
+    assert set(preview.fragments) == {"skills", "footer"}
+    assert preview.unchanged == ["intro"]
+    assert preview.fragments["skills"].html == "<ul><li>SQL</li></ul>"
+
+
+def test_fragment_hash_covers_the_variables(renderer):
+    first = _render(renderer, _resume())
+    known = {name: fragment.hash for name, fragment in first.fragments.items()}
+
+    preview = _render(
+        renderer, _resume(), {"footer": "bye"}, known, first.template_hash
+    )
+
+    assert set(preview.fragments) == {"intro", "skills", "footer"}
+    assert preview.fragments["footer"].html == "bye"
+
+
+def test_outdated_template_hash_resends_everything(renderer):
+    first = _render(renderer, _resume())
+    known = {name: fragment.hash for name, fragment in first.fragments.items()}
+
+    preview = _render(renderer, _resume(), None, known, "outdated")
+
+    assert preview.html is not None
+    assert preview.unchanged == []
+
+
+def test_unknown_template(renderer):
+    assert renderer.render("missing.html.j2", _resume(), None) is None
@@ -0,0 +1,33 @@
+from app.core.render_cache import RenderCache, render_cache_key
+import os
+import pytest
+
+
+def _key(**variables) -> str:
+    return render_cache_key("{}", "template", variables, {"format": "A4"})
+
+
+def test_put_and_get(tmp_path):
+    cache = RenderCache(folder=str(tmp_path), max_bytes=1 << 20)
+    cache.put(_key(), "html", b"<h1>Jane</h1>")
+
+    assert cache.get(_key(), "html") == b"<h1>Jane</h1>"
+    assert cache.get(_key(), "pdf") is None
+
+
+def test_key_depends_on_every_input():
+    assert _key() != _key(color="blue")
+    assert _key() != render_cache_key("{}", "other", None, {"format": "A4"})
+    assert _key() != render_cache_key(
+        "{}", "template", None, {"format": "A4"}, {"icons/github.png": "1"}
+    )
+
+
+@pytest.mark.parametrize("key", ["../escape", "A" * 64, "0" * 63, "0" * 64 + "/x"])
+def test_invalid_keys_are_rejected(tmp_path, key):
+    cache = RenderCache(folder=str(tmp_path / "cache"), max_bytes=1 << 20)
+
+    assert cache.get(key, "html") is None
+    with pytest.raises(ValueError):
+        cache.put(key, "html", b"data")
+    assert os.listdir(cache.folder) == []
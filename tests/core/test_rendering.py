@@ -0,0 +1,94 @@
+from app.core.browser_pool import BrowserPool
+from app.core.render_cache import RenderCache
+from app.core.rendering import (
+    PreparedRender,
+    RenderArtifact,
+    RenderNotFound,
+    RenderPipeline,
+)
+from app.core.storage import AsyncDocumentStorage, LocalDocumentStorage
+from app.core.templates import TemplateRegistry
+import asyncio
+import os
+import shutil
+import pytest
+
+DOCUMENTS = os.path.join(os.path.dirname(__file__), "..", "..", "documents")
+
+
+@pytest.fixture
+def pipeline(tmp_path) -> RenderPipeline:
+    storage = LocalDocumentStorage(base_folder=str(tmp_path / "documents"))
+    shutil.copy(
+        os.path.join(DOCUMENTS, "resumes", "Jane Doe.yaml"), storage.resume_folder
+    )
+    with open(os.path.join(storage.template_folder, "plain.html.j2"), "w") as f:
+        f.write("<h1>{{ resume.name }}</h1>{{ variables.get('note', '') }}")
+    return RenderPipeline(
+        storage=AsyncDocumentStorage(storage),
+        registry=TemplateRegistry(template_folder=storage.template_folder),
+        browser_pool=BrowserPool(),
+        cache=RenderCache(folder=str(tmp_path / "cache"), max_bytes=1 << 20),
+    )
+
+
+def _render(pipeline: RenderPipeline, template_name: str, resume_name: str, **vars):
+    return asyncio.run(
+        pipeline.render(template_name, resume_name, vars or None, pdf=False)
+    )
+
+
+def test_render_html(pipeline):
+    artifact = _render(pipeline, "plain.html.j2", "Jane Doe.yaml")
+
+    assert isinstance(artifact, RenderArtifact)
+    assert artifact.html.startswith("<h1>")
+
+
+def test_missing_template_is_not_found_and_not_cached(pipeline):
+    result = _render(pipeline, "missing.html.j2", "Jane Doe.yaml")
+
+    assert result == RenderNotFound("Template not found")
+    assert pipeline.cache is not None
+    assert os.listdir(pipeline.cache.folder) == []
+
+
+def test_missing_resume_is_not_found(pipeline):
+    result = _render(pipeline, "plain.html.j2", "Nobody.yaml")
+
+    assert result == RenderNotFound("Resume not found")
+
+
+def test_prepare_computes_the_key_without_rendering(pipeline):
+    prepared = asyncio.run(pipeline.prepare("plain.html.j2", "Jane Doe.yaml", None))
+
+    assert isinstance(prepared, PreparedRender)
+    assert pipeline.cache is not None
+    assert os.listdir(pipeline.cache.folder) == []
+    artifact = asyncio.run(pipeline.render_prepared(prepared, pdf=False))
+    assert artifact.id == prepared.key
+    assert artifact.etag == prepared.etag
+
+
+def _key(pipeline: RenderPipeline, **vars) -> str:
+    prepared = asyncio.run(
+        pipeline.prepare("plain.html.j2", "Jane Doe.yaml", vars or None)
+    )
+    assert isinstance(prepared, PreparedRender)
+    return prepared.key
+
+
+def test_render_key_changes_with_every_input(pipeline):
+    key = _key(pipeline)
+    assert _key(pipeline) == key
+    assert _key(pipeline, note="hi") != key
+
+    template_path = os.path.join(pipeline.registry.template_folder, "plain.html.j2")
+    with open(template_path, "a") as f:
+        f.write("<footer></footer>")
+    assert _key(pipeline) != key
+
+    storage = pipeline.storage.storage
+    resume = storage.get_resume("Jane Doe.yaml").model_copy(update={"title": "CTO"})
+    storage.save_resume(resume.dump_to_yaml_string(), "Jane Doe.yaml")
+    assert _key(pipeline) not in (key, _key(pipeline, note="hi"))
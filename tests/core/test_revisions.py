@@ -0,0 +1,82 @@
+from app.core.revisions import RevisionStore, content_hash, diff_resumes
+from app.models.link import Link
+from app.models.resume import Resume
+from app.models.skill import Skill
+
+
+def test_versions_increase_and_content_is_kept(tmp_path):
+    store = RevisionStore(str(tmp_path))
+
+    first = store.add("cv.yaml", "name: A\n")
+    second = store.add("cv.yaml", "name: B\n")
+
+    assert [first.version, second.version] == [1, 2]
+    assert second.content_hash == content_hash("name: B\n")
+    assert store.head("cv.yaml") == store.get("cv.yaml", 2)
+    assert store.read("cv.yaml", first) == "name: A\n"
+
+
+def test_compaction_keeps_the_newest_revisions(tmp_path):
+    store = RevisionStore(str(tmp_path), max_revisions=2)
+
+    for i in range(5):
+        store.add("cv.yaml", f"name: {i}\n")
+
+    assert [revision.version for revision in store.list_revisions("cv.yaml")] == [4, 5]
+    # versions keep counting after compaction
+    assert store.add("cv.yaml", "name: 5\n").version == 6
+
+
+def test_etag_covers_version_and_content(tmp_path):
+    store = RevisionStore(str(tmp_path))
+
+    first = store.add("cv.yaml", "name: A\n")
+    second = store.add("cv.yaml", "name: A\n")
+
+    assert first.etag != second.etag
+
+
+def _resume(**fields) -> Resume:
+    return Resume.model_validate(
+        {"id": "res_jane", "name": "Jane", "date_of_birth": "2000-01-01", **fields}
+    )
+
+
+def _skills(*names: str):
+    return [Skill(id=f"ski_{name}", name=name) for name in names]
+
+
+def test_diff_reports_fields_and_items():
+    old = _resume(skills=_skills("a", "b", "c"))
+    new = _resume(title="Engineer", skills=_skills("a", "c", "d"))
+    new.skills[0].name = "A"
+
+    diff = diff_resumes(old, new)
+
+    assert diff.fields == {"title": "Engineer"}
+    skills = diff.collections["skills"]
+    assert [item["id"] for item in skills.added] == ["ski_d"]
+    assert [item["id"] for item in skills.changed] == ["ski_a"]
+    assert skills.removed == ["ski_b"]
+    assert skills.order is None
+    assert "links" not in diff.collections
+
+
+def test_diff_reports_order_only_when_items_moved():
+    old = _resume(skills=_skills("a", "b"))
+
+    appended = diff_resumes(old, _resume(skills=_skills("a", "b", "c")))
+    moved = diff_resumes(old, _resume(skills=_skills("b", "a")))
+    inserted = diff_resumes(old, _resume(skills=_skills("c", "a", "b")))
+
+    assert appended.collections["skills"].order is None
+    assert moved.collections["skills"].order == ["ski_b", "ski_a"]
+    assert inserted.collections["skills"].order == ["ski_c", "ski_a", "ski_b"]
+
+
+def test_diff_of_equal_resumes_is_empty():
+    resume = _resume(links=[Link(id="lin_a")])
+
+    diff = diff_resumes(resume, resume.model_copy(deep=True))
+
+    assert diff.fields == {} and diff.collections == {}
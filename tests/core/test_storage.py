@@ -0,0 +1,114 @@
+from app.core.storage import LocalDocumentStorage, ResumeVersionConflict
+from app.models.resume import Resume
+from app.models.skill import Skill
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pytest
+
+RESUME = "name: Jane\ndate_of_birth: '2000-01-01'\n"
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalDocumentStorage:
+    return LocalDocumentStorage(base_folder=str(tmp_path))
+
+
+def _write(storage: LocalDocumentStorage, name: str, content: str):
+    with open(os.path.join(storage.resume_folder, name), "w") as f:
+        f.write(content)
+
+
+def test_get_revision_doesnt_record_anything(storage):
+    _write(storage, "cv.yaml", RESUME)
+
+    revision = storage.get_revision("cv.yaml")
+
+    assert revision is not None and revision.version == 1
+    assert storage.revisions.list_revisions("cv.yaml") == []
+    assert storage.list_revisions("cv.yaml") == [revision]
+    assert storage.get_revision("missing.yaml") is None
+
+
+def test_save_records_edits_made_outside_the_api(storage):
+    _write(storage, "cv.yaml", RESUME)
+
+    revision = storage.save_resume(RESUME.replace("Jane", "Janet"), "cv.yaml")
+
+    assert revision.version == 2
+    assert [r.version for r in storage.revisions.list_revisions("cv.yaml")] == [1, 2]
+    old = storage.get_resume_revision("cv.yaml", 1)
+    assert old is not None and old.name == "Jane"
+
+
+def test_save_with_current_etag(storage):
+    first = storage.save_resume(RESUME, "cv.yaml")
+
+    second = storage.save_resume(RESUME + "title: Dev\n", "cv.yaml", first.etag)
+
+    assert second.version == 2
+    assert storage.get_revision("cv.yaml") == second
+
+
+def test_save_with_stale_etag_conflicts(storage):
+    first = storage.save_resume(RESUME, "cv.yaml")
+    current = storage.save_resume(RESUME + "title: Dev\n", "cv.yaml")
+
+    with pytest.raises(ResumeVersionConflict) as conflict:
+        storage.save_resume(RESUME + "title: Ops\n", "cv.yaml", first.etag)
+
+    assert conflict.value.current == current
+    assert storage.get_resume("cv.yaml").title == "Dev"
+
+
+def test_if_match_any_requires_an_existing_resume(storage):
+    with pytest.raises(ResumeVersionConflict):
+        storage.save_resume(RESUME, "cv.yaml", "*")
+
+    storage.save_resume(RESUME, "cv.yaml")
+    assert storage.save_resume(RESUME + "title: Dev\n", "cv.yaml", "*").version == 2
+
+
+def test_update_resume_saves_the_change(storage):
+    storage.save_resume(RESUME, "cv.yaml")
+
+    result, revision = storage.update_resume(
+        "cv.yaml", lambda resume: resume.insert_element("skills", {"name": "SQL"})
+    )
+
+    assert revision is not None and revision.version == 2
+    assert storage.get_resume("cv.yaml").skills == [result]
+
+
+def test_failed_update_saves_nothing(storage):
+    first = storage.save_resume(RESUME, "cv.yaml")
+
+    def fail(resume: Resume):
+        resume.skills.append(Skill(name="SQL"))
+        raise ValueError("invalid")
+
+    with pytest.raises(ValueError):
+        storage.update_resume("cv.yaml", fail)
+    result, revision = storage.update_resume(
+        "cv.yaml", lambda resume: resume.delete_element("missing")
+    )
+
+    assert result is False and revision == first
+    assert storage.get_resume("cv.yaml").skills == []
+    assert storage.get_revision("cv.yaml") == first
+
+
+def test_concurrent_updates_are_all_applied(storage):
+    storage.save_resume(RESUME, "cv.yaml")
+
+    def add_skill(i: int):
+        storage.update_resume(
+            "cv.yaml",
+            lambda resume: resume.insert_element("skills", {"name": f"skill {i}"}),
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(add_skill, range(16)))
+
+    assert len(storage.get_resume("cv.yaml").skills) == 16
+    revision = storage.get_revision("cv.yaml")
+    assert revision is not None and revision.version == 17
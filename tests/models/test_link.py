@@ -0,0 +1,31 @@
+from app.models import link
+from app.models.link import Link
+import pytest
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    resolved = []
+
+    def resolve(rel_path):
+        resolved.append(rel_path)
+        return "data:image/png;base64,AAAA" if rel_path.endswith("github.png") else None
+
+    monkeypatch.setattr(link, "_icon_resolver", resolve)
+    return resolved
+
+
+def test_link_icon_is_the_resolved_data_uri(resolver):
+    icon = Link(link_type="github").link_icon
+
+    assert icon == "data:image/png;base64,AAAA"
+    assert resolver == ["icons/github.png"]
+
+
+def test_link_icon_falls_back_to_the_path(resolver):
+    assert Link(link_type="website").link_icon == "icons/website.png"
+
+
+def test_link_icon_path_is_not_resolved(resolver):
+    assert Link(link_type="github").link_icon_path == "icons/github.png"
+    assert resolver == []
@@ -0,0 +1,120 @@
+from app.models.link import Link
+from app.models.resume import Resume
+from app.models.skill import Skill
+import pytest
+
+
+@pytest.fixture
+def resume() -> Resume:
+    return Resume(
+        name="Jane",
+        date_of_birth="2000-01-01",  # type: ignore[arg-type]
+        skills=[Skill(id=f"ski_{name}", name=name) for name in "abc"],
+        links=[Link(id="lin_a", label="site")],
+    )
+
+
+def _ids(resume: Resume):
+    return [skill.id for skill in resume.skills]
+
+
+def _assert_index_consistent(resume: Resume):
+    for collection, elements in (("skills", resume.skills), ("links", resume.links)):
+        for index, element in enumerate(elements):
+            assert resume.find_element(element.id) == (collection, index)
+    assert resume._element_index == resume._build_element_index()
+
+
+@pytest.mark.parametrize(
+    "index, expected",
+    [
+        (None, ["ski_a", "ski_b", "ski_c", "ski_new"]),
+        (0, ["ski_new", "ski_a", "ski_b", "ski_c"]),
+        (1, ["ski_a", "ski_new", "ski_b", "ski_c"]),
+        (-1, ["ski_a", "ski_b", "ski_new", "ski_c"]),
+        (-10, ["ski_new", "ski_a", "ski_b", "ski_c"]),
+        (10, ["ski_a", "ski_b", "ski_c", "ski_new"]),
+    ],
+)
+def test_insert_element(resume, index, expected):
+    resume.find_element("ski_a")  # build the index
+
+    resume.insert_element("skills", {"id": "ski_new", "name": "new"}, index)
+
+    assert _ids(resume) == expected
+    _assert_index_consistent(resume)
+
+
+def test_insert_duplicate_id(resume):
+    with pytest.raises(ValueError):
+        resume.insert_element("links", {"id": "ski_a"})
+
+
+def test_delete_element(resume):
+    resume.find_element("ski_a")
+
+    assert resume.delete_element("ski_a")
+    assert not resume.delete_element("ski_a")
+
+    assert _ids(resume) == ["ski_b", "ski_c"]
+    assert resume.find_element("ski_a") is None
+    _assert_index_consistent(resume)
+
+
+@pytest.mark.parametrize(
+    "element_id, index, expected",
+    [
+        ("ski_a", 2, ["ski_b", "ski_c", "ski_a"]),
+        ("ski_c", 0, ["ski_c", "ski_a", "ski_b"]),
+        ("ski_a", -1, ["ski_b", "ski_a", "ski_c"]),
+        ("ski_c", -10, ["ski_c", "ski_a", "ski_b"]),
+        ("ski_a", 10, ["ski_b", "ski_c", "ski_a"]),
+    ],
+)
+def test_move_element(resume, element_id, index, expected):
+    resume.find_element("ski_a")
+
+    assert resume.move_element(element_id, index)
+
+    assert _ids(resume) == expected
+    _assert_index_consistent(resume)
+
+
+def test_index_survives_changes_outside_the_element_methods(resume):
+    resume.find_element("ski_a")
+
+    resume.skills.reverse()
+    resume.links = []
+
+    assert resume.find_element("ski_a") == ("skills", 2)
+    assert resume.find_element("lin_a") is None
+    _assert_index_consistent(resume)
+
+
+def test_update_element_keeps_the_id_and_checks_the_type(resume):
+    assert resume.update_element_by_id("ski_b", Skill(name="B"))
+    element = resume.get_element_by_id("ski_b")
+    assert isinstance(element, Skill) and element.name == "B"
+
+    with pytest.raises(TypeError):
+        resume.update_element_by_id("ski_b", Link())
+
+
+def test_patch_element_rejects_unknown_fields(resume):
+    patched = resume.patch_element("ski_a", {"name": "A"})
+    assert isinstance(patched, Skill) and patched.name == "A"
+
+    with pytest.raises(ValueError):
+        resume.patch_element("ski_a", {"url": "https://example.com"})
+    assert resume.patch_element("missing", {"name": "x"}) is None
+
+
+def test_visible_only_filters_collections(resume):
+    resume.skills[1].visible = False
+
+    view = resume.visible_only()
+
+    assert [skill.id for skill in view.skills] == ["ski_a", "ski_c"]
+    assert view.name == "Jane"
+    assert len(view.to_resume().skills) == 2
+    assert len(resume.skills) == 3
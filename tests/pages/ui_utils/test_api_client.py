@@ -0,0 +1,56 @@
+from app.pages.ui_utils import api_client
+
+
+class RecordingClient:
+    def __init__(self):
+        self.headers = []
+
+    def post(self, path, json=None, headers=None, **kwargs):
+        self.headers.append(headers)
+
+
+def _save(monkeypatch, resume_data, etag, loaded_file):
+    client = RecordingClient()
+    monkeypatch.setattr(api_client, "get_api_client", lambda: client)
+    monkeypatch.setattr(api_client, "invalidate_resumes", lambda: None)
+    api_client.save_resume(resume_data, etag, loaded_file)
+    return client.headers[0]
+
+
+def test_save_to_loaded_file_sends_if_match(monkeypatch):
+    headers = _save(monkeypatch, {"name": "cv"}, '"abc"', "cv.yaml")
+    assert headers == {"If-Match": '"abc"'}
+
+
+def test_save_after_rename_skips_if_match(monkeypatch):
+    headers = _save(monkeypatch, {"name": "renamed"}, '"abc"', "cv.yaml")
+    assert headers == {}
+
+
+def test_save_new_resume_skips_if_match(monkeypatch):
+    headers = _save(monkeypatch, {"name": "cv"}, None, None)
+    assert headers == {}
+
+
+class StreamingResponse:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_lines(self):
+        return iter(self.lines)
+
+
+def test_stream_lines_decodes_utf8(monkeypatch):
+    client = api_client.ApiClient(api_client.FrontendConfig())
+    response = StreamingResponse([b'{"text": "caf\xc3\xa9"}', b'{"type": "done"}'])
+    monkeypatch.setattr(client.session, "request", lambda *args, **kwargs: response)
+
+    lines = list(client.stream_lines("/chat/", {}))
+
+    assert lines == ['{"text": "café"}', '{"type": "done"}']